@@ -31,11 +31,13 @@ from __future__ import annotations
 
 import argparse
 import atexit
+import errno
 import gc
 import inspect
 import json
 import logging
 import math
+import mmap
 import os
 import re
 import shutil
@@ -45,8 +47,8 @@ import sys
 import tempfile
 import time
 import traceback as tb_module
-import copy
 import struct as struct_module
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from pathlib import Path
@@ -55,6 +57,7 @@ from typing import Any, Callable, Iterable, Literal, NoReturn, cast
 
 import UnityPy
 from PIL import Image, ImageOps
+from UnityPy.enums import ClassIDType
 from UnityPy.enums.BundleFile import CompressionFlags
 from UnityPy.files.SerializedFile import SerializedType
 from UnityPy.helpers import CompressionHelper
@@ -69,6 +72,16 @@ try:
 except Exception:  # pragma: no cover - KR: 선택적 의존성 / EN: optional dependency
     texture2ddecoder = None
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - KR: 선택적 의존성 / EN: optional dependency
+    np = None
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - KR: 선택적 의존성 / EN: optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -340,6 +353,18 @@ _TMP_GLYPH_INDEX_LIST_KEYS = (
     "m_GlyphIndexList",
     "m_GlyphIndexes",
 )
+# KR: TMP 판정 신호 키 (하나도 없으면 TMP 폰트 에셋이 아님)
+# EN: TMP detection signal keys (none present means not a TMP font asset)
+_TMP_SCHEMA_SIGNAL_KEYS = frozenset(
+    (
+        "m_GlyphTable",
+        "m_glyphInfoList",
+        "m_FaceInfo",
+        "m_fontInfo",
+        "m_AtlasTextures",
+        "atlas",
+    )
+)
 # KR: Unity 에셋 번들 시그니처 문자열 집합
 # EN: Unity asset bundle signature string set
 BUNDLE_SIGNATURES = {"UnityFS", "UnityWeb", "UnityRaw"}
@@ -502,31 +527,124 @@ def _compose_log_message(*parts: object, sep: str = " ") -> str:
     return sep.join(str(part) for part in parts)
 
 
+VERBOSE_LOG_FLUSH_EVERY = 64  # KR: 상세 로그 flush 주기(레코드 수) / EN: Verbose log flush interval (records)
+VERBOSE_LOG_BUFFER_BYTES = 64 * 1024  # KR: 상세 로그 파일 버퍼 크기 / EN: Verbose log file buffer size
+# KR: --scan-jobs 기본값. 워커마다 에셋 파일을 통째로 로드하므로 CPU 수를 따르되 메모리를 고려해 4개로 제한합니다.
+# EN: Default for --scan-jobs. Each worker loads a whole assets file, so follow the CPU count but cap at 4 for memory.
+DEFAULT_SCAN_JOBS = max(1, min(4, os.cpu_count() or 1))
+
+
+class _ThrottledFileHandler(logging.FileHandler):
+    """KR: 레코드마다 flush하지 않고 일정 건수마다(또는 WARNING 이상일 때) flush하는 파일 핸들러.
+    종료 시에는 logging.shutdown/close에서 남은 버퍼를 기록한다.
+    EN: File handler that flushes every N records (or on WARNING and above) instead of per record.
+    Remaining buffered output is written by logging.shutdown/close on exit.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: str | None = None,
+        flush_every: int = VERBOSE_LOG_FLUSH_EVERY,
+    ) -> None:
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.flush_every = max(1, int(flush_every))
+        self._pending_records = 0
+
+    def _open(self) -> Any:
+        # KR: 기본 8KB 버퍼로는 flush 주기 사이에도 write가 여러 번 나가므로, 한 주기 분량을 담을 버퍼로 엽니다.
+        # EN: The default 8 KB buffer spills several writes between flushes; open with room for a full flush interval.
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=VERBOSE_LOG_BUFFER_BYTES,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending_records += 1
+        if (
+            self._pending_records >= self.flush_every
+            or record.levelno >= logging.WARNING
+        ):
+            self.flush()
+            self._pending_records = 0
+
+
+class _ThrottledStreamHandler(logging.StreamHandler):
+    """KR: 리다이렉트된 stdout용 스트림 핸들러. 레코드마다 flush하지 않고 일정 건수마다(또는 WARNING 이상일 때) flush한다.
+    EN: Stream handler for redirected stdout that flushes every N records (or on WARNING and above) instead of per record.
+    """
+
+    def __init__(
+        self,
+        stream: Any = None,
+        flush_every: int = VERBOSE_LOG_FLUSH_EVERY,
+    ) -> None:
+        super().__init__(stream)
+        self.flush_every = max(1, int(flush_every))
+        self._pending_records = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending_records += 1
+        if (
+            self._pending_records >= self.flush_every
+            or record.levelno >= logging.WARNING
+        ):
+            self.flush()
+            self._pending_records = 0
+
+
 def _configure_logging(
     console_level: int = logging.INFO,
     verbose_log_path: str | None = None,
+    throttle_console: bool = False,
 ) -> None:
     """KR: 콘솔 및 선택적 파일 로그 핸들러를 구성한다.
     매개변수:
         console_level: 콘솔 출력 로그 레벨 (기본: INFO)
         verbose_log_path: 상세 로그 파일 경로 (None이면 파일 로그 비활성화)
+        throttle_console: True이면 콘솔 출력을 레코드마다 flush하지 않음 (리다이렉트된 stdout용)
 
     EN: Configure console and optional file log handlers.
     Args:
         console_level: 콘솔 출력 로그 레벨 (기본: INFO)
         verbose_log_path: 상세 로그 파일 경로 (None이면 파일 로그 비활성화)
+        throttle_console: True이면 콘솔 출력을 레코드마다 flush하지 않음 (리다이렉트된 stdout용)
     """
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.setLevel(logging.DEBUG if verbose_log_path else console_level)
 
-    console_handler = logging.StreamHandler(stream=sys.stdout)
+    console_handler: logging.StreamHandler = (
+        _ThrottledStreamHandler(stream=sys.stdout)
+        if throttle_console
+        else logging.StreamHandler(stream=sys.stdout)
+    )
     console_handler.setLevel(console_level)
     console_handler.setFormatter(logging.Formatter(LOG_CONSOLE_FORMAT))
     root_logger.addHandler(console_handler)
 
     if verbose_log_path:
-        file_handler = logging.FileHandler(
+        file_handler = _ThrottledFileHandler(
             verbose_log_path,
             mode="w",
             encoding="utf-8",
@@ -596,8 +714,12 @@ def _log_console(
 
 def _log_debug(*parts: object, sep: str = " ") -> None:
     """KR: 디버그 레벨 로그를 기록한다.
+    --verbose가 아니면 DEBUG가 꺼져 있으므로 메시지 조합 전에 바로 반환한다.
     EN: Record a debug-level log entry.
+    Without --verbose DEBUG is disabled, so return before composing the message.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     logger.debug(_compose_log_message(*parts, sep=sep))
 
 
@@ -2165,25 +2287,62 @@ def _ps5_unswizzle_bc_best_layout_match(
     )
 
 
+@lru_cache(maxsize=32)
+def _list_dir_cached(
+    dir_path: str, mtime_ns: int
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    """KR: 폴더의 전체 항목 이름과 파일명 집합(normcase)을 반환합니다. mtime_ns는 캐시 무효화 키입니다.
+    EN: Returns the folder's entry names and its file name set (normcased). mtime_ns is the cache invalidation key.
+    """
+    names: list[str] = []
+    file_names: set[str] = set()
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            names.append(entry.name)
+            if entry.is_file():
+                file_names.add(os.path.normcase(entry.name))
+    return tuple(names), frozenset(file_names)
+
+
+def _listdir(dir_path: str) -> tuple[str, ...]:
+    """KR: 폴더 mtime 기준으로 캐시된 os.listdir 결과를 반환한다 (항목 추가/삭제/이름 변경 시 갱신).
+    없는 폴더는 os.listdir과 같은 예외를 낸다.
+    EN: Return os.listdir results cached by folder mtime (refreshed on add/remove/rename).
+    Missing folders raise the same exceptions as os.listdir.
+    """
+    return _list_dir_cached(dir_path, os.stat(dir_path).st_mtime_ns)[0]
+
+
+def _dir_file_names(dir_path: str) -> frozenset[str]:
+    """KR: _listdir와 같은 캐시에서 파일명 집합(normcase)을 반환한다. 없는 폴더는 빈 집합이다.
+    EN: Return the normcased file name set from the same cache as _listdir. Missing folders yield an empty set.
+    """
+    try:
+        return _list_dir_cached(dir_path, os.stat(dir_path).st_mtime_ns)[1]
+    except OSError:
+        return frozenset()
+
+
 def find_ggm_file(data_path: str) -> str | None:
     """KR: 데이터 폴더에서 globalgamemanagers 계열 파일 경로를 찾는다.
     EN: Find the globalgamemanagers family file path in the data folder.
     """
     candidates = ["globalgamemanagers", "globalgamemanagers.assets", "data.unity3d"]
     candidates_resources = ["unity default resources", "unity_builtin_extra"]
-    fls: list[str] = []
-    # KR: globalgamemanagers 핵심 파일을 우선 탐색한다
-    # EN: Search for globalgamemanagers core files first
+    normcase = os.path.normcase
+    # KR: 후보마다 stat하지 않고 폴더당 한 번 캐시된 파일명 집합으로 확인한다
+    # EN: Check against a cached per-folder file name set instead of stat-ing each candidate
+    # KR: globalgamemanagers 핵심 파일을 우선 탐색하고, 첫 번째로 찾은 경로를 바로 반환한다
+    # EN: Search for globalgamemanagers core files first and return the first hit right away
+    data_names = _dir_file_names(data_path)
     for candidate in candidates:
-        ggm_path = os.path.join(data_path, candidate)
-        if os.path.exists(ggm_path):
-            fls.append(ggm_path)
+        if normcase(candidate) in data_names:
+            return os.path.join(data_path, candidate)
+    resources_path = os.path.join(data_path, "Resources")
+    resources_names = _dir_file_names(resources_path)
     for candidate in candidates_resources:
-        ggm_path = os.path.join(data_path, "Resources", candidate)
-        if os.path.exists(ggm_path):
-            fls.append(ggm_path)
-    if fls:
-        return fls[0]
+        if normcase(candidate) in resources_names:
+            return os.path.join(resources_path, candidate)
     return None
 
 
@@ -2200,7 +2359,7 @@ def resolve_game_path(path: str, lang: Language = "ko") -> tuple[str, str]:
         game_path = path
         data_folders = [
             d
-            for d in os.listdir(path)
+            for d in _listdir(path)
             if d.lower().endswith("_data") and os.path.isdir(os.path.join(path, d))
         ]
 
@@ -2228,7 +2387,7 @@ def get_data_path(game_path: str, lang: Language = "ko") -> str:
     """KR: 게임 루트에서 _Data 폴더 경로를 반환한다.
     EN: Return the _Data folder path from the game root.
     """
-    data_folders = [i for i in os.listdir(game_path) if i.lower().endswith("_data")]
+    data_folders = [i for i in _listdir(game_path) if i.lower().endswith("_data")]
     if not data_folders:
         if lang == "ko":
             raise FileNotFoundError(f"'{game_path}'에서 _Data 폴더를 찾을 수 없습니다.")
@@ -2236,9 +2395,60 @@ def get_data_path(game_path: str, lang: Language = "ko") -> str:
     return os.path.join(game_path, data_folders[0])
 
 
+_UNITY_VERSION_TEXT_RE = re.compile(r"\d{1,4}\.\d+\.\d+[A-Za-z0-9.\-]*")
+
+
+def _peek_unity_version(path: str) -> str | None:
+    """KR: UnityPy.load 없이 UnityFS 번들/직렬화 파일 헤더에서 Unity 버전 문자열만 읽는다.
+    직렬화 파일은 버전 문자열이 헤더에 있는 포맷 9 이상만 읽고, 그보다 오래된 포맷은 메타데이터가
+    파일 끝에 있으므로 None을 돌려 UnityPy.load 경로에 맡긴다.
+    헤더 형식을 알 수 없거나 버전이 지워진(0.0.0) 경우 None을 반환한다.
+    EN: Read just the Unity version string from a UnityFS bundle or serialized file header, without UnityPy.load.
+    Serialized files are only read for format 9+, where the version string follows the header; older formats
+    keep their metadata at the end of the file, so None is returned and UnityPy.load handles them.
+    Returns None for unknown header layouts or stripped (0.0.0) versions.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(256)
+    except OSError:
+        return None
+
+    version_bytes = b""
+    if header.startswith(b"UnityFS\x00"):
+        # KR: signature, u32 포맷 버전, 플레이어 버전("5.x.x"), 엔진 리비전 순서
+        # EN: signature, u32 format version, player version ("5.x.x"), engine revision
+        parts = header[12:].split(b"\x00", 2)
+        if len(parts) == 3:
+            version_bytes = parts[1]
+    elif len(header) >= 20:
+        # KR: 직렬화 파일 헤더: 빅엔디언 u32 4개, endian/예약 4바이트, (v22+) 확장 필드 28바이트 뒤에 버전 문자열
+        # EN: Serialized file header: four big-endian u32s, endian/reserved 4 bytes, (v22+) 28 extended bytes, then the version
+        # KR: v9 미만은 endian과 버전이 파일 끝 메타데이터에 있으므로 여기서는 읽지 않는다
+        # EN: Below v9 the endian byte and version live in the trailing metadata, so they are not read here
+        _, _, format_version, _ = struct.unpack_from(">4I", header, 0)
+        if not 9 <= format_version <= 64:
+            return None
+        offset = 20
+        if format_version >= 22:
+            offset += 28
+        version_bytes = header[offset:].split(b"\x00", 1)[0]
+
+    try:
+        version = version_bytes.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+    if not _UNITY_VERSION_TEXT_RE.fullmatch(version) or version.startswith("0.0.0"):
+        return None
+    return version
+
+
+@lru_cache(maxsize=8)
 def get_unity_version(game_path: str, lang: Language = "ko") -> str:
     """KR: 게임 경로에서 Unity 버전을 읽어 반환한다.
+    같은 게임 경로의 반복 조회는 캐시된 결과를 재사용한다.
     EN: Read and return the Unity version from the game path.
+    Repeated lookups for the same game path reuse the cached result.
     """
     data_path = get_data_path(game_path, lang=lang)
     candidates = [
@@ -2256,6 +2466,13 @@ def get_unity_version(game_path: str, lang: Language = "ko") -> str:
             f"Could not find a globalgamemanagers file in '{data_path}'.\nPlease verify this is a valid Unity game folder."
         )
 
+    # KR: 헤더에 버전이 있으면 대형 파일(data.unity3d 등)을 UnityPy로 통째로 로드하지 않는다
+    # EN: When the header carries the version, avoid a full UnityPy load of large files (data.unity3d etc.)
+    for candidate in existing_candidates:
+        peeked_version = _peek_unity_version(candidate)
+        if peeked_version:
+            return peeked_version
+
     for candidate in existing_candidates:
         env = None
         try:
@@ -2299,9 +2516,12 @@ def get_unity_version(game_path: str, lang: Language = "ko") -> str:
     raise RuntimeError(f"Failed to detect Unity version. Tried files: {tried}")
 
 
+@lru_cache(maxsize=1)
 def get_script_dir() -> str:
     """KR: 실행 기준 디렉터리(스크립트/배포 바이너리)를 반환한다.
+    프로세스 동안 바뀌지 않으므로 교체 대상마다 호출돼도 한 번만 계산한다.
     EN: Return the execution base directory (script/distribution binary).
+    It does not change during the process, so it is computed once even though it is called per replacement target.
     """
     if getattr(sys, "frozen", False):
         return os.path.dirname(sys.executable)
@@ -2484,6 +2704,51 @@ def prepare_output_only_dependencies(
             )
 
 
+def prefetch_output_only_targets(
+    source_files: Iterable[str],
+    data_path: str,
+    output_root: str,
+    max_workers: int = 4,
+) -> set[str]:
+    """KR: output-only 모드에서 처리 대상 파일들을 출력 루트로 병렬 복사한다.
+    파일별 교체 작업은 지연 패치 상태를 공유하므로 순차로 두고, 서로 독립적인 복사만 미리 처리한다.
+    복사에 성공한 대상의 정규화 키 집합을 반환하며, 실패한 파일은 기존처럼 루프에서 다시 복사된다.
+    EN: Copy queued target files into the output root in parallel for output-only mode.
+    Per-file replacement shares deferred-patch state and stays sequential; only the independent copies run ahead.
+    Returns normalized keys of copied targets; failed files are copied again by the main loop as before.
+    """
+    copy_jobs: dict[str, tuple[str, str]] = {}
+    for source_file in source_files:
+        output_path = resolve_output_only_path(source_file, data_path, output_root)
+        output_key = _normalize_asset_file_key(output_path) or output_path
+        if output_key not in copy_jobs:
+            copy_jobs[output_key] = (source_file, output_path)
+    if not copy_jobs:
+        return set()
+
+    def _copy_one(job: tuple[str, str]) -> None:
+        source_file, output_path = job
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        shutil.copy2(source_file, output_path)
+
+    copied: set[str] = set()
+    worker_count = max(1, min(int(max_workers), len(copy_jobs)))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        future_to_key = {
+            executor.submit(_copy_one, job): output_key
+            for output_key, job in copy_jobs.items()
+        }
+        for future in as_completed(future_to_key):
+            try:
+                future.result()
+            except Exception:
+                continue
+            copied.add(future_to_key[future])
+    return copied
+
+
 def register_temp_dir_for_cleanup(path: str) -> str:
     """KR: 종료 시 삭제할 임시 디렉터리를 등록하고 정규화 경로를 반환한다.
     EN: Register a temp directory for cleanup on exit and return the normalized path.
@@ -2493,6 +2758,37 @@ def register_temp_dir_for_cleanup(path: str) -> str:
     return normalized
 
 
+def _fast_rmtree(path: str, max_workers: int = 8) -> None:
+    """KR: 디렉터리를 삭제합니다. 최상위 항목을 스레드 풀로 나눠 지워 파일마다 기다리는
+    unlink/rmdir 지연(백신 검사, 네트워크 드라이브 등)을 겹치게 하고, 남은 항목과 루트는
+    shutil.rmtree로 마무리해 오류 동작은 기존과 같게 유지합니다.
+    EN: Delete a directory tree. Top-level entries are removed on a thread pool so per-file
+    unlink/rmdir latency (AV scanning, network drives) overlaps; shutil.rmtree then removes
+    whatever is left plus the root, keeping the original error behavior.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = [(entry.path, entry.is_dir(follow_symlinks=False)) for entry in it]
+    except OSError:
+        entries = []
+    if len(entries) > 1:
+
+        def _remove_entry(entry: tuple[str, bool]) -> None:
+            entry_path, is_dir = entry
+            if is_dir:
+                shutil.rmtree(entry_path, ignore_errors=True)
+            else:
+                try:
+                    os.unlink(entry_path)
+                except OSError:
+                    pass
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(entries))) as executor:
+            for _ in executor.map(_remove_entry, entries):
+                pass
+    shutil.rmtree(path)
+
+
 def cleanup_registered_temp_dirs() -> None:
     """KR: 등록된 임시 디렉터리를 깊은 경로부터 안전하게 삭제한다.
     EN: Safely delete registered temp directories starting from deepest paths.
@@ -2519,33 +2815,32 @@ def _close_unitypy_reader(obj: Any) -> None:
     """
     if obj is None:
         return
+    # KR: 각 정리 메서드는 있으면 바로 호출하고, 없을 때의 AttributeError도 다른 실패와 함께 무시합니다.
+    #     hasattr/getattr 선조회를 하지 않아 메서드마다 속성 조회가 한 번으로 줄어듭니다.
+    # EN: Call each cleanup method directly and ignore AttributeError for missing ones along with other failures.
+    #     Skipping the hasattr/getattr probe leaves one attribute lookup per method.
     # KR: BundleFile의 mmap/temp 블록 저장소 정리
     # EN: Clean up BundleFile's mmap/temp block storage
-    cleanup_fn = getattr(obj, "_cleanup_temp_blocks_storage", None)
-    if callable(cleanup_fn):
-        try:
-            cleanup_fn()
-        except Exception:
-            pass
+    try:
+        obj._cleanup_temp_blocks_storage()
+    except Exception:
+        pass
     # KR: SerializedFile의 spill store (temp 파일) 정리
     # EN: Clean up SerializedFile's spill store (temp file)
-    close_fn = getattr(obj, "close", None)
-    if callable(close_fn):
-        try:
-            close_fn()
-        except Exception:
-            pass
+    try:
+        obj.close()
+    except Exception:
+        pass
     reader = getattr(obj, "reader", None)
-    if reader is not None and hasattr(reader, "dispose"):
+    if reader is not None:
         try:
             reader.dispose()
         except Exception:
             pass
-    if hasattr(obj, "dispose"):
-        try:
-            obj.dispose()
-        except Exception:
-            pass
+    try:
+        obj.dispose()
+    except Exception:
+        pass
 
 
 def close_unitypy_env(environment: Any) -> None:
@@ -2566,27 +2861,20 @@ def close_unitypy_env(environment: Any) -> None:
             stack.extend(sub_files.values())
 
 
+# KR: 확장자(.png/.json/.otf/.ttf 순서, 대소문자 무시) 뒤 SDF/Raster 접미사 하나를 한 번에 제거합니다.
+# EN: Strips extensions (.png/.json/.otf/.ttf order, case-insensitive) plus one SDF/Raster suffix in one pass.
+_FONT_NAME_SUFFIX_RE = re.compile(
+    r"(?: SDF Atlas| Raster Atlas| Atlas| SDF Material| Raster Material| Material| SDF| Raster)?"
+    r"(?i:(?:\.png)?(?:\.json)?(?:\.otf)?(?:\.ttf)?)$"
+)
+
+
+@lru_cache(maxsize=4096)
 def normalize_font_name(name: str) -> str:
     """KR: 확장자/SDF 접미사를 제거해 폰트 기본 이름으로 정규화한다.
     EN: Normalize to the base font name by removing extensions/SDF suffixes.
     """
-    for ext in [".ttf", ".otf", ".json", ".png"]:
-        if name.lower().endswith(ext):
-            name = name[: -len(ext)]
-    for suffix in (
-        " SDF Atlas",
-        " Raster Atlas",
-        " Atlas",
-        " SDF Material",
-        " Raster Material",
-        " Material",
-        " SDF",
-        " Raster",
-    ):
-        if name.endswith(suffix):
-            name = name[: -len(suffix)]
-            break
-    return name
+    return _FONT_NAME_SUFFIX_RE.sub("", name, count=1)
 
 
 def parse_bool_flag(value: Any) -> bool:
@@ -3222,16 +3510,22 @@ def _prepare_texture_replacement_for_target(
     }
 
 
+def _image_alpha8_channel(image: Image.Image) -> Image.Image:
+    """KR: Pillow 이미지에서 Alpha8로 기록할 단일 채널(L) 이미지를 얻습니다.
+    EN: Get the single-channel (L) image that is written as Alpha8 from a Pillow image.
+    """
+    if image.mode in {"RGBA", "LA"}:
+        return image.getchannel("A")
+    if image.mode == "L":
+        return image
+    return image.convert("L")
+
+
 def _image_to_alpha8_bytes(image: Image.Image) -> tuple[bytes, int, int]:
     """KR: Pillow 이미지를 Alpha8 raw bytes로 변환합니다.
     EN: Convert a Pillow image to Alpha8 raw bytes.
     """
-    if image.mode in {"RGBA", "LA"}:
-        alpha = image.getchannel("A")
-    elif image.mode == "L":
-        alpha = image
-    else:
-        alpha = image.convert("L")
+    alpha = _image_alpha8_channel(image)
     return alpha.tobytes(), alpha.width, alpha.height
 
 
@@ -3244,15 +3538,19 @@ def _encode_alpha8_replacement_bytes(
     """KR: Alpha8 교체 바이트를 타겟 swizzle 상태에 맞게 인코딩합니다.
     EN: Encode Alpha8 replacement bytes to match the target swizzle state.
     """
+    # KR: 채널 추출을 먼저 해 flip/swizzle이 RGBA 4채널 대신 1채널만 처리하게 합니다.
+    # EN: Extract the channel first so flip/swizzle handle one channel instead of four RGBA channels.
     if ps5_swizzle and target_swizzled_state is True:
-        alpha_linear, aw, ah = _image_to_alpha8_bytes(alpha_source)
-        alpha_linear_img = Image.frombytes("L", (int(aw), int(ah)), alpha_linear)
-        alpha_swizzled_img = apply_ps5_swizzle_to_image(alpha_linear_img)
+        alpha_swizzled_img = apply_ps5_swizzle_to_image(
+            _image_alpha8_channel(alpha_source)
+        )
         alpha_raw, aw, ah = _image_to_alpha8_bytes(alpha_swizzled_img)
         return alpha_raw, aw, ah, "swizzled"
 
     if (not ps5_swizzle) or target_swizzled_state is False:
-        alpha_raw, aw, ah = _image_to_alpha8_bytes(ImageOps.flip(alpha_source))
+        alpha_raw, aw, ah = _image_to_alpha8_bytes(
+            ImageOps.flip(_image_alpha8_channel(alpha_source))
+        )
         return alpha_raw, aw, ah, "linear_flipped"
 
     alpha_raw, aw, ah = _image_to_alpha8_bytes(alpha_source)
@@ -3585,6 +3883,8 @@ def _ps5_roughness_score(
     """
     data, _ = _ps5_clip_to_base_level(data, width, height, bytes_per_element)
     _ps5_validate_texture_shape(data, width, height, bytes_per_element)
+    if np is not None:
+        return _ps5_roughness_score_numpy(data, width, height, bytes_per_element)
     view = memoryview(data)
     bpe = bytes_per_element
 
@@ -3652,6 +3952,60 @@ def _ps5_roughness_score(
     return float(dx + dy)
 
 
+def _ps5_roughness_score_numpy(
+    data: bytes,
+    width: int,
+    height: int,
+    bytes_per_element: int,
+) -> float:
+    """KR: _ps5_roughness_score와 같은 샘플링 규칙을 NumPy 배열 연산으로 계산합니다.
+    텍스처 평면을 한 번만 뷰로 만들고 행/열 차분을 벡터화합니다.
+    EN: Computes _ps5_roughness_score with the same sampling rules via NumPy array ops.
+    Builds a single view over the texture plane and vectorizes row/column deltas.
+    """
+    bpe = bytes_per_element
+    max_sample_lines = 256
+    row_step = max(1, height // max_sample_lines)
+    col_step = max(1, width // max_sample_lines)
+    pixels = np.frombuffer(data, dtype=np.uint8, count=width * height * bpe).reshape(
+        height, width, bpe
+    )
+
+    channel_index = 0
+    if bpe > 1:
+        # KR: 분산이 가장 높은 채널을 선택 (동률이면 앞 채널 우선)
+        #     순수 Python 경로와 같은 E[x²]-mean² 식을 써야 근소한 동률에서도 같은 채널이 선택됩니다.
+        #     합계는 정수로 정확히 구하므로 float 변환 후 계산 결과도 Python 경로와 비트 단위로 같습니다.
+        # EN: Select the highest-variance channel (earlier channel wins ties)
+        #     Use the same E[x²]-mean² formula as the pure-Python path so near-ties pick the same channel.
+        #     Sums are exact integers, so the float math afterwards matches the Python path bit for bit.
+        sample = pixels[::row_step, ::col_step, :].reshape(-1, bpe).astype(np.int64)
+        sample_count = int(sample.shape[0])
+        if sample_count > 0:
+            sums = sample.sum(axis=0)
+            sums_sq = (sample * sample).sum(axis=0)
+            best_var = -1.0
+            for ch in range(bpe):
+                mean = float(sums[ch]) / sample_count
+                variance = (float(sums_sq[ch]) / sample_count) - (mean * mean)
+                if variance > best_var:
+                    best_var = variance
+                    channel_index = ch
+
+    plane = pixels[:, :, channel_index]
+    dx = 0.0
+    if width > 1:
+        rows = plane[::row_step, :].astype(np.int16)
+        dx_delta = np.abs(np.diff(rows, axis=1))
+        dx = float(dx_delta.sum()) / dx_delta.size
+    dy = 0.0
+    if height > 1:
+        cols = plane[:, ::col_step].astype(np.int16)
+        dy_delta = np.abs(np.diff(cols, axis=0))
+        dy = float(dy_delta.sum()) / dy_delta.size
+    return float(dx + dy)
+
+
 def detect_ps5_swizzle_state(
     data: bytes,
     width: int,
@@ -3659,9 +4013,12 @@ def detect_ps5_swizzle_state(
     bytes_per_element: int,
     mask_x: int | None = None,
     mask_y: int | None = None,
+    verdict_only: bool = False,
 ) -> tuple[str, float, float, float, bytes, bytes]:
     """KR: 입력 바이트가 swizzled인지 휴리스틱으로 판별합니다.
+    verdict_only=True면 raw/unswizzle 점수만으로 판정이 끝날 때 swizzle 후보 계산을 생략합니다.
     EN: Heuristically determine whether input bytes are swizzled.
+    With verdict_only=True, skips the swizzle candidate when raw/unswizzle scores already decide the verdict.
     """
     data, _ = _ps5_clip_to_base_level(data, width, height, bytes_per_element)
     if not _ps5_dimensions_supported(width, height, bytes_per_element):
@@ -3673,10 +4030,18 @@ def detect_ps5_swizzle_state(
     unswizzled = ps5_unswizzle_bytes(
         data, width, height, bytes_per_element, mask_x=mask_x, mask_y=mask_y
     )
+    unsw_score = _ps5_roughness_score(unswizzled, width, height, bytes_per_element)
+    if (
+        verdict_only
+        and unsw_score >= raw_score * 0.92
+        and raw_score > unsw_score * 0.92
+    ):
+        # KR: raw/unswizzle 차이가 임계값 미만이면 swizzle 점수와 무관하게 판정 불가입니다.
+        # EN: When raw/unswizzle differ by less than the threshold, the verdict is inconclusive regardless of the swizzle score.
+        return "inconclusive", raw_score, unsw_score, raw_score, unswizzled, data
     swizzled = ps5_swizzle_bytes(
         data, width, height, bytes_per_element, mask_x=mask_x, mask_y=mask_y
     )
-    unsw_score = _ps5_roughness_score(unswizzled, width, height, bytes_per_element)
     swz_score = _ps5_roughness_score(swizzled, width, height, bytes_per_element)
 
     if unsw_score < raw_score * 0.92 and unsw_score <= swz_score * 0.98:
@@ -3810,6 +4175,7 @@ def detect_ps5_swizzle_state_from_image(
     mask_x: int | None = None,
     mask_y: int | None = None,
     rotate: int = PS5_SWIZZLE_ROTATE,
+    verdict_only: bool = False,
 ) -> tuple[str, float, float, float]:
     """KR: Pillow 이미지의 swizzle 상태를 판별합니다.
     EN: Determine the swizzle state of a Pillow image.
@@ -3825,6 +4191,7 @@ def detect_ps5_swizzle_state_from_image(
         bytes_per_element,
         mask_x=mask_x,
         mask_y=mask_y,
+        verdict_only=verdict_only,
     )
     return verdict, raw_score, unsw_score, swz_score
 
@@ -4049,6 +4416,7 @@ def detect_texture_object_ps5_swizzle_detail(
                 mask_x=mask_x,
                 mask_y=mask_y,
                 rotate=rotate,
+                verdict_only=True,
             )
             return verdict, "image"
         return None, None
@@ -4066,6 +4434,12 @@ def build_replacement_lookup(
     """
     lookup: dict[tuple[str, str, str, int], str] = {}
     files_to_process: set[str] = set()
+    # KR: 항목 수가 많은 JSON에서 반복 조회를 줄이도록 자주 쓰는 호출을 지역 변수로 고정합니다.
+    # EN: Bind hot callables to locals to cut repeated lookups on large replacement JSON.
+    add_file = files_to_process.add
+    normalize = normalize_font_name
+    _str = str
+    _int = int
 
     for info in replacements.values():
         replace_to = info.get("Replace_to")
@@ -4074,35 +4448,37 @@ def build_replacement_lookup(
 
         file_name_raw = info.get("File")
         assets_name_raw = info.get("assets_name")
-        path_id_raw = info.get("Path_ID")
         type_name_raw = info.get("Type")
-
-        if not isinstance(file_name_raw, str) or not file_name_raw:
-            continue
-        if not isinstance(assets_name_raw, str) or not assets_name_raw:
-            continue
-        if not isinstance(type_name_raw, str) or not type_name_raw:
+        if not (
+            type(file_name_raw) is _str
+            and file_name_raw
+            and type(assets_name_raw) is _str
+            and assets_name_raw
+            and type(type_name_raw) is _str
+            and type_name_raw
+        ):
             continue
+        path_id_raw = info.get("Path_ID")
         if path_id_raw is None:
             continue
 
         try:
-            path_id = int(path_id_raw)
+            path_id = _int(path_id_raw)
         except (TypeError, ValueError):
             continue
 
-        normalized_target = normalize_font_name(str(replace_to))
-        lookup[(type_name_raw, file_name_raw, assets_name_raw, path_id)] = (
-            normalized_target
+        lookup[(type_name_raw, file_name_raw, assets_name_raw, path_id)] = normalize(
+            _str(replace_to)
         )
-        files_to_process.add(file_name_raw)
+        add_file(file_name_raw)
 
     return lookup, files_to_process
 
 
+@lru_cache(maxsize=1)
 def debug_parse_enabled() -> bool:
-    """KR: 디버그 파싱 로그 활성화 여부를 반환합니다.
-    EN: Returns whether debug parse logging is enabled.
+    """KR: 디버그 파싱 로그 활성화 여부를 반환합니다. 환경 변수는 프로세스당 한 번만 읽습니다.
+    EN: Returns whether debug parse logging is enabled. The environment variable is read once per process.
     """
     return os.environ.get("UFR_DEBUG_PARSE", "").strip() == "1"
 
@@ -4176,12 +4552,14 @@ def _log_replacement_plan_details(
         _log_debug(f"[replace_plan] file={file_name} targets=0")
         return
 
-    ttf_count = sum(
-        1 for item in replacement_mapping.values() if item.get("Type") == "TTF"
-    )
-    sdf_count = sum(
-        1 for item in replacement_mapping.values() if item.get("Type") == "SDF"
-    )
+    ttf_count = 0
+    sdf_count = 0
+    for item in replacement_mapping.values():
+        font_type = item.get("Type")
+        if font_type == "TTF":
+            ttf_count += 1
+        elif font_type == "SDF":
+            sdf_count += 1
     _log_debug(
         f"[replace_plan] file={file_name} targets={len(replacement_mapping)} ttf={ttf_count} sdf={sdf_count}"
     )
@@ -4218,9 +4596,12 @@ def ensure_int(data: JsonDict | None, keys: Iterable[str]) -> None:
     """
     if not data:
         return
+    # KR: 이미 int인 값은 다시 쓰지 않습니다 (공유 템플릿/재실행 시 대부분 이미 int).
+    # EN: Values that are already int are not rewritten (the usual case for shared templates and reruns).
     for key in keys:
-        if key in data and data[key] is not None:
-            data[key] = int(data[key])
+        value = data.get(key)
+        if value is not None and value.__class__ is not int:
+            data[key] = int(value)
 
 
 @lru_cache(maxsize=256)
@@ -4245,8 +4626,7 @@ def _load_tmp_info_unity_field_index() -> dict[tuple[int, int, int], set[str]]:
         )
         if not os.path.exists(path):
             return {}
-        with open(path, "r", encoding="utf-8") as f:
-            obj = json.load(f)
+        obj = _read_json_file(path)
         snapshots = obj.get("snapshots", []) if isinstance(obj, dict) else []
         index: dict[tuple[int, int, int], set[str]] = {}
         if not isinstance(snapshots, list):
@@ -4853,7 +5233,11 @@ def _load_spilled_plan_image(
     path_key: str,
 ) -> Image.Image | None:
     """KR: 디스크에 스필된 이미지 경로로부터 PIL 이미지를 다시 로드합니다.
+    같은 계획을 공유하는 타겟들이 한 번 디코드한 이미지를 함께 쓰도록 Atlas 디코드 캐시를 거칩니다.
+    같은 객체가 돌아오므로 id 기반 Alpha8 인코딩 캐시도 타겟 사이에서 적중합니다.
     EN: Reloads a PIL image from a spilled image path on disk.
+    Goes through the atlas decode cache so targets sharing a plan reuse one decoded image;
+    since the same object comes back, the id-keyed Alpha8 encode cache also hits across targets.
     """
     image = payload.get(image_key)
     if isinstance(image, Image.Image):
@@ -4861,9 +5245,7 @@ def _load_spilled_plan_image(
     image_path = str(payload.get(path_key, "")).strip()
     if not image_path or not os.path.exists(image_path):
         return None
-    loaded_image = Image.open(image_path)
-    loaded_image.load()
-    return loaded_image
+    return _decode_atlas_file(image_path)
 
 
 def _cleanup_deferred_patch_bucket(bucket: dict[str, Any] | None) -> None:
@@ -4948,9 +5330,12 @@ def _register_deferred_patch(
         pending_files.add(normalized_file)
 
 
+@lru_cache(maxsize=1)
 def _unitypy_supports_streaming_save() -> bool:
     """KR: 현재 UnityPy가 메모리 절감용 save_to() 스트리밍 저장 API를 지원하는지 확인합니다.
+    로드된 UnityPy는 프로세스 동안 바뀌지 않으므로 한 번만 검사합니다.
     EN: Checks whether the current UnityPy supports the memory-saving save_to() streaming save API.
+    The loaded UnityPy does not change within a process, so this is checked only once.
     """
     try:
         from UnityPy.files.BundleFile import BundleFile as _BundleFile
@@ -5241,22 +5626,40 @@ def _apply_material_replacement_to_object(parse_dict: Any, mat_info: JsonDict) -
     else:
         float_props = getattr(saved_props, "m_Floats", None)
         if isinstance(float_props, list):
+            has_texture_height = False
+            has_texture_width = False
+            has_gradient_scale = False
+            # KR: 아래 분기 중 하나라도 건드릴 수 있는 이름만 모아, 나머지 속성은 바로 건너뜁니다.
+            # EN: Collect only names that any branch below can touch and skip every other property up front.
+            touched_float_names = {
+                "_GradientScale",
+                "_TextureHeight",
+                "_TextureWidth",
+                *_MATERIAL_OUTLINE_RATIO_KEYS,
+                *float_overrides,
+            }
+            if preserve_game_style:
+                touched_float_names.update(_MATERIAL_STYLE_FLOAT_KEYS)
+            # KR: m_Floats를 한 번만 훑어 이름별 첫 위치 색인, 수정 전 원래 값, 처리할 위치 목록을 함께 만듭니다.
+            # EN: Walk m_Floats once to build the first-position index by name, the pre-edit values,
+            #     and the list of positions to process.
+            first_float_index: dict[str, int] = {}
             existing_float_map: dict[str, float] = {}
-            for entry in float_props:
+            touched_positions: list[int] = []
+            for i, entry in enumerate(float_props):
                 if not isinstance(entry, (list, tuple)) or len(entry) < 2:
                     continue
+                prop_name = str(entry[0])
+                first_float_index.setdefault(prop_name, i)
+                if prop_name not in touched_float_names:
+                    continue
+                touched_positions.append(i)
                 try:
-                    existing_float_map[str(entry[0])] = float(entry[1])
+                    existing_float_map[prop_name] = float(entry[1])
                 except Exception:
-                    continue
-
-            has_texture_height = False
-            has_texture_width = False
-            has_gradient_scale = False
-            for i in range(len(float_props)):
+                    pass
+            for i in touched_positions:
                 entry = float_props[i]
-                if not isinstance(entry, (list, tuple)) or len(entry) < 2:
-                    continue
                 prop_name = str(entry[0])
                 if prop_name == "_GradientScale":
                     candidate: float | None = None
@@ -5386,6 +5789,7 @@ def _apply_material_replacement_to_object(parse_dict: Any, mat_info: JsonDict) -
                 changed = True
             if gradient_scale is not None and not has_gradient_scale:
                 float_props.append(("_GradientScale", float(gradient_scale)))
+                first_float_index.setdefault("_GradientScale", len(float_props) - 1)
                 changed = True
 
             # KR: _ScaleRatioA를 교체 아틀라스의 padding/GradientScale로 재계산합니다.
@@ -5394,20 +5798,20 @@ def _apply_material_replacement_to_object(parse_dict: Any, mat_info: JsonDict) -
             # In TMP, ScaleRatioA = padding / GradientScale; mismatch causes incorrect outline/shadow sizes.
             if replacement_padding > 0:
                 final_gs = None
-                for _fp in float_props:
-                    if isinstance(_fp, (list, tuple)) and len(_fp) >= 2 and _fp[0] == "_GradientScale":
-                        try:
-                            final_gs = float(_fp[1])
-                        except Exception:
-                            pass
-                        break
-                if final_gs and final_gs > 0:
+                gs_index = first_float_index.get("_GradientScale")
+                if gs_index is not None:
+                    try:
+                        final_gs = float(float_props[gs_index][1])
+                    except Exception:
+                        pass
+                scale_ratio_index = first_float_index.get("_ScaleRatioA")
+                if final_gs and final_gs > 0 and scale_ratio_index is not None:
                     new_scale_ratio_a = replacement_padding / final_gs
-                    for k, fp in enumerate(float_props):
-                        if isinstance(fp, (list, tuple)) and len(fp) >= 2 and fp[0] == "_ScaleRatioA":
-                            float_props[k] = ("_ScaleRatioA", float(new_scale_ratio_a))
-                            changed = True
-                            break
+                    float_props[scale_ratio_index] = (
+                        "_ScaleRatioA",
+                        float(new_scale_ratio_a),
+                    )
+                    changed = True
 
             if outline_fallback_used:
                 logger.debug(
@@ -5461,25 +5865,22 @@ def detect_tmp_version(
     """
     new_glyph_count = _safe_list_len(data.get("m_GlyphTable"))
     old_glyph_count = _safe_list_len(data.get("m_glyphInfoList"))
-    has_new_glyphs = new_glyph_count > 0
-    has_old_glyphs = old_glyph_count > 0
-
-    has_new_face = isinstance(data.get("m_FaceInfo"), dict)
-    has_old_face = isinstance(data.get("m_fontInfo"), dict)
-    has_new_atlas = _first_atlas_ref(data.get("m_AtlasTextures")) is not None
-    has_old_atlas = isinstance(data.get("atlas"), dict)
 
     # KR: 두 포맷 키가 동시에 있어도 실제 글리프가 있는 쪽을 우선합니다.
     # EN: Even if both format keys exist, the side with actual glyphs takes priority.
-    if has_new_glyphs != has_old_glyphs:
-        return "new" if has_new_glyphs else "old"
+    # KR: 대부분 여기서 판정되므로 face/atlas 신호는 필요할 때만 계산합니다.
+    # EN: Most inputs are decided here, so face/atlas signals are computed only when needed.
     if new_glyph_count != old_glyph_count:
         return "new" if new_glyph_count > old_glyph_count else "old"
 
     # KR: 글리프가 비슷하면 face/atlas 신호를 비교합니다.
     # EN: If glyph counts are similar, compare face/atlas signals.
+    has_new_face = isinstance(data.get("m_FaceInfo"), dict)
+    has_old_face = isinstance(data.get("m_fontInfo"), dict)
     if has_new_face != has_old_face:
         return "new" if has_new_face else "old"
+    has_new_atlas = _first_atlas_ref(data.get("m_AtlasTextures")) is not None
+    has_old_atlas = isinstance(data.get("atlas"), dict)
     if has_new_atlas != has_old_atlas:
         return "new" if has_new_atlas else "old"
 
@@ -5573,6 +5974,66 @@ def extract_tmp_atlas_padding(
     return 0.0
 
 
+# KR: face info 변환 테이블 (출력 키, 입력 키, 기본값). 입력 키가 None이면 기본값을 상수로 씁니다.
+# EN: Face info conversion tables (output key, input key, default). A None input key writes the default as a constant.
+_FACE_INFO_NEW_TO_OLD_MAP: tuple[tuple[str, str | None, Any], ...] = (
+    ("Name", "m_FamilyName", ""),
+    ("PointSize", "m_PointSize", 0),
+    ("Scale", "m_Scale", 1.0),
+    ("CharacterCount", None, 0),
+    ("LineHeight", "m_LineHeight", 0),
+    ("Baseline", "m_Baseline", 0),
+    ("Ascender", "m_AscentLine", 0),
+    ("CapHeight", "m_CapLine", 0),
+    ("Descender", "m_DescentLine", 0),
+    ("CenterLine", "m_MeanLine", 0),
+    ("SuperscriptOffset", "m_SuperscriptOffset", 0),
+    ("SubscriptOffset", "m_SubscriptOffset", 0),
+    ("SubSize", "m_SubscriptSize", 0.5),
+    ("Underline", "m_UnderlineOffset", 0),
+    ("UnderlineThickness", "m_UnderlineThickness", 0),
+    ("strikethrough", "m_StrikethroughOffset", 0),
+    ("strikethroughThickness", "m_StrikethroughThickness", 0),
+    ("TabWidth", "m_TabWidth", 0),
+)
+_FACE_INFO_OLD_TO_NEW_MAP: tuple[tuple[str, str | None, Any], ...] = (
+    ("m_FaceIndex", None, 0),
+    ("m_FamilyName", "Name", ""),
+    ("m_StyleName", None, "regular"),
+    ("m_PointSize", "PointSize", 0),
+    ("m_Scale", "Scale", 1.0),
+    ("m_UnitsPerEM", None, 0),
+    ("m_LineHeight", "LineHeight", 0),
+    ("m_AscentLine", "Ascender", 0),
+    ("m_CapLine", "CapHeight", 0),
+    ("m_MeanLine", "CenterLine", 0),
+    ("m_Baseline", "Baseline", 0),
+    ("m_DescentLine", "Descender", 0),
+    ("m_SuperscriptOffset", "SuperscriptOffset", 0),
+    ("m_SuperscriptSize", None, 0.5),
+    ("m_SubscriptOffset", "SubscriptOffset", 0),
+    ("m_SubscriptSize", "SubSize", 0.5),
+    ("m_UnderlineOffset", "Underline", 0),
+    ("m_UnderlineThickness", "UnderlineThickness", 0),
+    ("m_StrikethroughOffset", "strikethrough", 0),
+    ("m_StrikethroughThickness", "strikethroughThickness", 0),
+    ("m_TabWidth", "TabWidth", 0),
+)
+
+
+def _map_face_info(
+    source: JsonDict, mapping: tuple[tuple[str, str | None, Any], ...]
+) -> JsonDict:
+    """KR: 변환 테이블에 따라 face info 딕셔너리를 재구성합니다.
+    EN: Rebuilds a face info dict according to a conversion table.
+    """
+    get = source.get
+    return {
+        out_key: default if in_key is None else get(in_key, default)
+        for out_key, in_key, default in mapping
+    }
+
+
 def convert_face_info_new_to_old(
     face_info: JsonDict,
     atlas_padding: int = 0,
@@ -5582,58 +6043,18 @@ def convert_face_info_new_to_old(
     """KR: 신형 m_FaceInfo를 구형 m_fontInfo 구조로 변환합니다.
     EN: Converts new-format m_FaceInfo to old-format m_fontInfo structure.
     """
-    return {
-        "Name": face_info.get("m_FamilyName", ""),
-        "PointSize": face_info.get("m_PointSize", 0),
-        "Scale": face_info.get("m_Scale", 1.0),
-        "CharacterCount": 0,
-        "LineHeight": face_info.get("m_LineHeight", 0),
-        "Baseline": face_info.get("m_Baseline", 0),
-        "Ascender": face_info.get("m_AscentLine", 0),
-        "CapHeight": face_info.get("m_CapLine", 0),
-        "Descender": face_info.get("m_DescentLine", 0),
-        "CenterLine": face_info.get("m_MeanLine", 0),
-        "SuperscriptOffset": face_info.get("m_SuperscriptOffset", 0),
-        "SubscriptOffset": face_info.get("m_SubscriptOffset", 0),
-        "SubSize": face_info.get("m_SubscriptSize", 0.5),
-        "Underline": face_info.get("m_UnderlineOffset", 0),
-        "UnderlineThickness": face_info.get("m_UnderlineThickness", 0),
-        "strikethrough": face_info.get("m_StrikethroughOffset", 0),
-        "strikethroughThickness": face_info.get("m_StrikethroughThickness", 0),
-        "TabWidth": face_info.get("m_TabWidth", 0),
-        "Padding": atlas_padding,
-        "AtlasWidth": atlas_width,
-        "AtlasHeight": atlas_height,
-    }
+    font_info = _map_face_info(face_info, _FACE_INFO_NEW_TO_OLD_MAP)
+    font_info["Padding"] = atlas_padding
+    font_info["AtlasWidth"] = atlas_width
+    font_info["AtlasHeight"] = atlas_height
+    return font_info
 
 
 def convert_face_info_old_to_new(font_info: JsonDict) -> JsonDict:
     """KR: 구형 m_fontInfo를 신형 m_FaceInfo 구조로 변환합니다.
     EN: Converts old-format m_fontInfo to new-format m_FaceInfo structure.
     """
-    return {
-        "m_FaceIndex": 0,
-        "m_FamilyName": font_info.get("Name", ""),
-        "m_StyleName": "regular",
-        "m_PointSize": font_info.get("PointSize", 0),
-        "m_Scale": font_info.get("Scale", 1.0),
-        "m_UnitsPerEM": 0,
-        "m_LineHeight": font_info.get("LineHeight", 0),
-        "m_AscentLine": font_info.get("Ascender", 0),
-        "m_CapLine": font_info.get("CapHeight", 0),
-        "m_MeanLine": font_info.get("CenterLine", 0),
-        "m_Baseline": font_info.get("Baseline", 0),
-        "m_DescentLine": font_info.get("Descender", 0),
-        "m_SuperscriptOffset": font_info.get("SuperscriptOffset", 0),
-        "m_SuperscriptSize": 0.5,
-        "m_SubscriptOffset": font_info.get("SubscriptOffset", 0),
-        "m_SubscriptSize": font_info.get("SubSize", 0.5),
-        "m_UnderlineOffset": font_info.get("Underline", 0),
-        "m_UnderlineThickness": font_info.get("UnderlineThickness", 0),
-        "m_StrikethroughOffset": font_info.get("strikethrough", 0),
-        "m_StrikethroughThickness": font_info.get("strikethroughThickness", 0),
-        "m_TabWidth": font_info.get("TabWidth", 0),
-    }
+    return _map_face_info(font_info, _FACE_INFO_OLD_TO_NEW_MAP)
 
 
 def _new_glyph_rect_to_int(rect: JsonDict) -> tuple[int, int, int, int]:
@@ -5653,52 +6074,73 @@ def _tmp_flip_y_between_old_new(
     """KR: TMP old(top-origin) <-> new(bottom-origin) Y 변환 공식을 적용합니다.
     EN: Applies the TMP old(top-origin) <-> new(bottom-origin) Y conversion formula.
     """
-    if atlas_height is None:
+    atlas_h = _tmp_flip_atlas_height(atlas_height)
+    if atlas_h is None:
         return float(y_value)
+    return atlas_h - float(y_value) - float(glyph_height)
+
+
+def _tmp_flip_atlas_height(atlas_height: int | float | None) -> float | None:
+    """KR: Y 변환에 쓸 atlas 높이를 검증해 float로 반환합니다(무효면 None).
+    EN: Validates the atlas height used for Y conversion and returns it as float (None if invalid).
+    """
+    if atlas_height is None:
+        return None
     try:
         atlas_h = float(atlas_height)
     except Exception:
-        return float(y_value)
+        return None
     if atlas_h <= 0:
-        return float(y_value)
-    return atlas_h - float(y_value) - float(glyph_height)
+        return None
+    return atlas_h
 
 
 def convert_glyphs_new_to_old(
     glyph_table: list[JsonDict],
     char_table: list[JsonDict],
     atlas_height: int | None = None,
+    glyph_by_index: dict[int, JsonDict] | None = None,
 ) -> list[JsonDict]:
     """KR: 신형 글리프/문자 테이블을 구형 m_glyphInfoList로 변환합니다.
+    glyph_by_index를 주면 glyph_table 색인을 다시 만들지 않고 그대로 사용합니다.
     EN: Converts new-format glyph/character tables to old-format m_glyphInfoList.
-    """
-    glyph_by_index: dict[int, JsonDict] = {}
-    for g in glyph_table:
-        glyph_by_index[int(g.get("m_Index", 0))] = g
+    When glyph_by_index is given, it is used as-is instead of re-indexing glyph_table.
+    """
+    if glyph_by_index is None:
+        # KR: 문자 테이블이 참조하는 인덱스만 모아 필요한 글리프만 색인합니다.
+        # EN: Collect only indices referenced by the character table and index just those glyphs.
+        needed_indices = {char.get("m_GlyphIndex", 0) for char in char_table}
+        glyph_by_index = {}
+        _int = int
+        for g in glyph_table:
+            index = _int(g.get("m_Index", 0))
+            if index in needed_indices:
+                glyph_by_index[index] = g
     result: list[JsonDict] = []
+    append = result.append
+    # KR: atlas 높이 검증은 글리프마다 반복하지 않고 한 번만 수행합니다.
+    # EN: Validate the atlas height once instead of per glyph.
+    atlas_h = _tmp_flip_atlas_height(atlas_height)
+    _float = float
+    empty: JsonDict = {}
     for char in char_table:
-        unicode_val = char.get("m_Unicode", 0)
-        glyph_idx = char.get("m_GlyphIndex", 0)
-        g = glyph_by_index.get(glyph_idx, {})
-        metrics = g.get("m_Metrics", {})
-        rect = g.get("m_GlyphRect", {})
-        rect_h = float(rect.get("m_Height", 0))
-        rect_y = _tmp_flip_y_between_old_new(
-            float(rect.get("m_Y", 0)),
-            rect_h,
-            atlas_height,
-        )
-        result.append(
+        g = glyph_by_index.get(char.get("m_GlyphIndex", 0), empty)
+        metrics = g.get("m_Metrics", empty)
+        rect = g.get("m_GlyphRect", empty)
+        rect_y = _float(rect.get("m_Y", 0))
+        if atlas_h is not None:
+            rect_y = atlas_h - rect_y - _float(rect.get("m_Height", 0))
+        append(
             {
-                "id": int(unicode_val),
-                "x": float(rect.get("m_X", 0)),
+                "id": int(char.get("m_Unicode", 0)),
+                "x": _float(rect.get("m_X", 0)),
                 "y": rect_y,
-                "width": float(metrics.get("m_Width", 0)),
-                "height": float(metrics.get("m_Height", 0)),
-                "xOffset": float(metrics.get("m_HorizontalBearingX", 0)),
-                "yOffset": float(metrics.get("m_HorizontalBearingY", 0)),
-                "xAdvance": float(metrics.get("m_HorizontalAdvance", 0)),
-                "scale": float(g.get("m_Scale", 1.0)),
+                "width": _float(metrics.get("m_Width", 0)),
+                "height": _float(metrics.get("m_Height", 0)),
+                "xOffset": _float(metrics.get("m_HorizontalBearingX", 0)),
+                "yOffset": _float(metrics.get("m_HorizontalBearingY", 0)),
+                "xAdvance": _float(metrics.get("m_HorizontalAdvance", 0)),
+                "scale": _float(g.get("m_Scale", 1.0)),
             }
         )
     return result
@@ -5713,52 +6155,57 @@ def convert_glyphs_old_to_new(
     """
     glyph_table: list[JsonDict] = []
     char_table: list[JsonDict] = []
-    glyph_idx = 0
-    for glyph in glyph_info_list:
-        uid = glyph.get("id", 0)
-        old_rect_y = float(glyph.get("y", 0))
-        glyph_h = float(glyph.get("height", 0))
-        new_rect_y = _tmp_flip_y_between_old_new(old_rect_y, glyph_h, atlas_height)
-        glyph_table.append(
+    append_glyph = glyph_table.append
+    append_char = char_table.append
+    atlas_h = _tmp_flip_atlas_height(atlas_height)
+    for glyph_idx, glyph in enumerate(glyph_info_list):
+        get = glyph.get
+        width = get("width", 0)
+        height = get("height", 0)
+        new_rect_y = float(get("y", 0))
+        if atlas_h is not None:
+            new_rect_y = atlas_h - new_rect_y - float(height)
+        append_glyph(
             {
                 "m_Index": glyph_idx,
                 "m_Metrics": {
-                    "m_Width": glyph.get("width", 0),
-                    "m_Height": glyph.get("height", 0),
-                    "m_HorizontalBearingX": glyph.get("xOffset", 0),
-                    "m_HorizontalBearingY": glyph.get("yOffset", 0),
-                    "m_HorizontalAdvance": glyph.get("xAdvance", 0),
+                    "m_Width": width,
+                    "m_Height": height,
+                    "m_HorizontalBearingX": get("xOffset", 0),
+                    "m_HorizontalBearingY": get("yOffset", 0),
+                    "m_HorizontalAdvance": get("xAdvance", 0),
                 },
                 "m_GlyphRect": {
-                    "m_X": int(glyph.get("x", 0)),
+                    "m_X": int(get("x", 0)),
                     "m_Y": int(round(new_rect_y)),
-                    "m_Width": int(glyph.get("width", 0)),
-                    "m_Height": int(glyph.get("height", 0)),
+                    "m_Width": int(width),
+                    "m_Height": int(height),
                 },
-                "m_Scale": glyph.get("scale", 1.0),
+                "m_Scale": get("scale", 1.0),
                 "m_AtlasIndex": 0,
                 "m_ClassDefinitionType": 0,
             }
         )
-        char_table.append(
+        append_char(
             {
                 "m_ElementType": 1,
-                "m_Unicode": int(uid),
+                "m_Unicode": int(get("id", 0)),
                 "m_GlyphIndex": glyph_idx,
                 "m_Scale": 1.0,
             }
         )
-        glyph_idx += 1
     return glyph_table, char_table
 
 
 def normalize_sdf_data(data: JsonDict, deep_copy: bool = True) -> JsonDict:
     """KR: SDF 교체 데이터를 신형 TMP 형식으로 정규화해 반환합니다.
-    deep_copy=True면 입력 데이터를 복사해 원본 변형을 방지합니다.
+    deep_copy=True면 정규화 중 수정하는 하위 dict/list만 복사해 원본 변형을 방지합니다.
     EN: Normalizes SDF replacement data to new-format TMP and returns it.
-    deep_copy=True copies input data to prevent mutation of the original.
+    deep_copy=True copies only the nested dicts/lists touched here so the original is never mutated.
     """
-    result: JsonDict = copy.deepcopy(data) if deep_copy else data
+    # KR: 전체 deepcopy 대신 최상위만 얕게 복사하고, 아래에서 수정하는 컨테이너만 복제합니다.
+    # EN: Shallow-copy the top level instead of a full deepcopy; containers mutated below are cloned individually.
+    result: JsonDict = dict(data) if deep_copy else data
     version = detect_tmp_version(result)
 
     if version == "old":
@@ -5816,6 +6263,9 @@ def normalize_sdf_data(data: JsonDict, deep_copy: bool = True) -> JsonDict:
 
     face_info = result.get("m_FaceInfo")
     if isinstance(face_info, dict):
+        if deep_copy:
+            face_info = dict(face_info)
+            result["m_FaceInfo"] = face_info
         ensure_int(face_info, ["m_PointSize", "m_AtlasWidth", "m_AtlasHeight"])
 
     # KR: Atlas 참조 목록은 공유 변형을 피하기 위해 독립 딕셔너리로 재구성합니다.
@@ -5841,32 +6291,87 @@ def normalize_sdf_data(data: JsonDict, deep_copy: bool = True) -> JsonDict:
         )
     result["m_AtlasTextures"] = atlas_textures
 
-    glyph_table = result.get("m_GlyphTable")
+    _int = int
+    rect_int_keys = ("m_X", "m_Y", "m_Width", "m_Height")
+    # KR: 구형 변환 결과는 convert_glyphs_old_to_new가 이미 int로 만든 새 테이블이므로 재변환을 건너뜁니다.
+    # EN: Tables from the old-format conversion are fresh and already int-typed, so skip re-coercing them.
+    tables_fresh = version == "old"
+    glyph_table = None if tables_fresh else result.get("m_GlyphTable")
     if isinstance(glyph_table, list):
+        if deep_copy:
+            glyph_table = [
+                dict(glyph) if isinstance(glyph, dict) else glyph
+                for glyph in glyph_table
+            ]
+            result["m_GlyphTable"] = glyph_table
+        # KR: 대형 CJK 폰트는 글리프가 수만 개이므로 ensure_int 호출 대신 루프 안에서 직접 변환합니다.
+        #     JSON에서 이미 int로 읽힌 값은 다시 쓰지 않아 깨끗한 신형 입력은 읽기만 하고 지나갑니다.
+        # EN: Large CJK fonts have tens of thousands of glyphs, so coerce inline instead of calling ensure_int.
+        #     Values already parsed as int are not rewritten, so clean new-format input is only read.
         for glyph in glyph_table:
             if not isinstance(glyph, dict):
                 continue
-            ensure_int(glyph, ["m_Index", "m_AtlasIndex", "m_ClassDefinitionType"])
+            value = glyph.get("m_Index")
+            if value is not None and value.__class__ is not _int:
+                glyph["m_Index"] = _int(value)
+            value = glyph.get("m_AtlasIndex")
+            if value is not None and value.__class__ is not _int:
+                glyph["m_AtlasIndex"] = _int(value)
             glyph["m_ClassDefinitionType"] = 0
             rect = glyph.get("m_GlyphRect")
             if isinstance(rect, dict):
-                ensure_int(rect, ["m_X", "m_Y", "m_Width", "m_Height"])
-
-    char_table = result.get("m_CharacterTable")
+                if deep_copy:
+                    rect = dict(rect)
+                    glyph["m_GlyphRect"] = rect
+                for key in rect_int_keys:
+                    value = rect.get(key)
+                    if value is not None and value.__class__ is not _int:
+                        rect[key] = _int(value)
+
+    char_table = None if tables_fresh else result.get("m_CharacterTable")
     if isinstance(char_table, list):
+        if deep_copy:
+            char_table = [
+                dict(char) if isinstance(char, dict) else char for char in char_table
+            ]
+            result["m_CharacterTable"] = char_table
+        # KR: 문자 테이블은 키가 3개뿐이므로 내부 키 루프 없이 펼쳐서 변환합니다.
+        # EN: Character entries have only three int keys, so coerce them unrolled without an inner key loop.
         for char in char_table:
-            if isinstance(char, dict):
-                ensure_int(char, ["m_Unicode", "m_GlyphIndex", "m_ElementType"])
+            if not isinstance(char, dict):
+                continue
+            get = char.get
+            value = get("m_Unicode")
+            if value is not None and value.__class__ is not _int:
+                char["m_Unicode"] = _int(value)
+            value = get("m_GlyphIndex")
+            if value is not None and value.__class__ is not _int:
+                char["m_GlyphIndex"] = _int(value)
+            value = get("m_ElementType")
+            if value is not None and value.__class__ is not _int:
+                char["m_ElementType"] = _int(value)
 
     for rect_list_name in ["m_UsedGlyphRects", "m_FreeGlyphRects"]:
         rect_list = result.get(rect_list_name)
         if isinstance(rect_list, list):
+            if deep_copy:
+                rect_list = [
+                    dict(rect) if isinstance(rect, dict) else rect
+                    for rect in rect_list
+                ]
+                result[rect_list_name] = rect_list
             for rect in rect_list:
                 if isinstance(rect, dict):
-                    ensure_int(rect, ["m_X", "m_Y", "m_Width", "m_Height"])
+                    for key in rect_int_keys:
+                        value = rect.get(key)
+                        if value is not None and value.__class__ is not _int:
+                            rect[key] = _int(value)
 
     creation_settings = result.get("m_CreationSettings")
     if isinstance(creation_settings, dict):
+        if deep_copy:
+            creation_settings = dict(creation_settings)
+            result["m_CreationSettings"] = creation_settings
         ensure_int(
             creation_settings, ["pointSize", "atlasWidth", "atlasHeight", "padding"]
         )
@@ -5874,6 +6379,43 @@ def normalize_sdf_data(data: JsonDict, deep_copy: bool = True) -> JsonDict:
     return result
 
 
+# KR: 에셋 스캔에서 항상 제외하는 확장자 (소문자, endswith 튜플)
+# EN: Extensions always excluded from asset scans (lowercase, endswith tuple)
+_ASSET_SCAN_EXCLUDED_EXTS: tuple[str, ...] = (
+    ".dll",
+    ".manifest",
+    ".exe",
+    ".txt",
+    ".json",
+    ".xml",
+    ".log",
+    ".ini",
+    ".cfg",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".bmp",
+    ".wav",
+    ".mp3",
+    ".ogg",
+    ".mp4",
+    ".avi",
+    ".mov",
+    ".bak",
+    ".info",
+    ".config",
+    ".browser",
+    ".aspx",
+    ".map",
+    ".resource",
+    ".resources",
+    # KR: Texture2D 스트리밍 데이터(.resS)는 직렬화 파일이 아니며 대용량이라 로드 비용만 큼
+    # EN: Texture2D streaming data (.resS) is not a serialized file and is large, so loading it is pure cost
+    ".ress",
+)
+
+
 def find_assets_files(
     game_path: str,
     lang: Language = "ko",
@@ -5892,75 +6434,100 @@ def find_assets_files(
     normalized_targets = (
         {os.path.basename(name) for name in target_files} if target_files else None
     )
-    blacklist_exts = {
-        ".dll",
-        ".manifest",
-        ".exe",
-        ".txt",
-        ".json",
-        ".xml",
-        ".log",
-        ".ini",
-        ".cfg",
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".gif",
-        ".bmp",
-        ".wav",
-        ".mp3",
-        ".ogg",
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".bak",
-        ".info",
-        ".config",
-        ".browser",
-        ".aspx",
-        ".map",
-        ".resource",
-        ".resources",
-    }
+    blacklist_suffixes = _ASSET_SCAN_EXCLUDED_EXTS
     if exclude_exts:
-        blacklist_exts.update({str(ext).lower() for ext in exclude_exts if ext})
+        extra_exts = {str(ext).lower() for ext in exclude_exts if ext}
+        blacklist_suffixes = tuple(set(blacklist_suffixes) | extra_exts)
 
-    skip_root_prefixes = [
+    skip_root_prefixes = {
         os.path.normcase(
             os.path.normpath(os.path.join(data_path, "il2cpp_data", "etc", "mono"))
         )
-    ]
+    }
 
-    for root, dirs, files in os.walk(data_path):
-        normalized_root = os.path.normcase(os.path.normpath(root))
-        if any(
-            normalized_root == prefix
-            or normalized_root.startswith(prefix + os.sep)
-            for prefix in skip_root_prefixes
-        ):
-            dirs[:] = []
+    for file_path, fn in _iter_files(data_path, skip_root_prefixes):
+        if normalized_targets is not None and fn not in normalized_targets:
             continue
-        for fn in files:
-            if normalized_targets is not None and fn not in normalized_targets:
-                continue
-            ext = os.path.splitext(fn)[1].lower()
-            if ext in blacklist_exts:
-                continue
-            assets_files.append(os.path.join(root, fn))
+        # KR: 확장자가 없는 파일은 소문자 변환 없이 바로 통과시킵니다.
+        # EN: Files without an extension pass without a lowercase copy.
+        if "." in fn and fn.lower().endswith(blacklist_suffixes):
+            continue
+        assets_files.append(file_path)
     assets_files.sort()
     return assets_files
 
 
+def _iter_files(
+    root: str,
+    skip_dirs: set[str] | None = None,
+) -> Iterable[tuple[str, str]]:
+    """KR: os.scandir 스택으로 하위 파일을 (경로, 파일명)으로 순회합니다.
+    skip_dirs(normcase 경로)에 해당하는 폴더는 하위까지 건너뜁니다.
+    EN: Walks files under root with an os.scandir stack, yielding (path, name).
+    Directories listed in skip_dirs (normcased paths) are pruned entirely.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        if skip_dirs and os.path.normcase(os.path.normpath(current)) in skip_dirs:
+            continue
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        try:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path, entry.name
+                except OSError:
+                    continue
+        finally:
+            it.close()
+
+
 def get_compile_method(datapath: str) -> str:
     """KR: 데이터 폴더의 컴파일 방식을 Mono/Il2cpp로 판별합니다.
+    폴더 목록은 mtime 기준으로 캐시되므로, Il2CppDumper가 Managed를 만든 뒤의 재감지도 바로 반영됩니다.
     EN: Determines the compile method (Mono/Il2cpp) of the data folder.
+    The listing is cached by folder mtime, so re-detection after Il2CppDumper creates Managed sees it immediately.
     """
-    if "Managed" in os.listdir(datapath):
+    if "Managed" in _listdir(datapath):
         return "Mono"
     else:
         return "Il2cpp"
 
 
+# KR: 생성기는 DLL/메타데이터를 모두 들고 있어 크므로 소수만 LRU로 유지합니다.
+# EN: Generators hold all DLL/metadata payloads, so keep only a few in an LRU.
+_GENERATOR_CACHE_MAX = 4
+_GENERATOR_CACHE: OrderedDict[tuple[Any, ...], TypeTreeGenerator] = OrderedDict()
+
+
+def _managed_dll_signature(data_path: str) -> tuple[tuple[str, int, int], ...]:
+    """KR: Managed 폴더 DLL들의 (이름, mtime, 크기) 서명을 반환합니다.
+    EN: Returns a (name, mtime, size) signature of DLLs in the Managed folder.
+    """
+    managed_dir = os.path.join(data_path, "Managed")
+    signature: list[tuple[str, int, int]] = []
+    try:
+        with os.scandir(managed_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".dll"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return ()
+    signature.sort()
+    return tuple(signature)
+
+
 def _create_generator(
     unity_version: str,
     game_path: str,
@@ -5969,35 +6536,123 @@ def _create_generator(
     lang: Language = "ko",
 ) -> TypeTreeGenerator:
     """KR: 타입트리 생성기를 구성하고 Mono/Il2cpp 메타데이터를 로드합니다.
+    같은 게임/버전/컴파일 방식이면 캐시된 생성기를 재사용하며,
+    Mono는 DLL mtime이 바뀌면 다시 생성합니다.
     EN: Configures the TypeTree generator and loads Mono/Il2cpp metadata.
-    """
-    generator = TypeTreeGenerator(unity_version)
+    Reuses a cached generator for the same game/version/compile method;
+    Mono generators are rebuilt when DLL mtimes change.
+    """
+    cache_key: tuple[Any, ...] = (
+        unity_version,
+        os.path.normcase(os.path.abspath(game_path)),
+        os.path.normcase(os.path.abspath(data_path)),
+        compile_method,
+    )
     if compile_method == "Mono":
-        managed_dir = os.path.join(data_path, "Managed")
-        for fn in os.listdir(managed_dir):
-            if not fn.endswith(".dll"):
-                continue
-            try:
-                with open(os.path.join(managed_dir, fn), "rb") as f:
-                    generator.load_dll(f.read())
-            except Exception as e:
-                if lang == "ko":
-                    _log_console(f"[generator] DLL 로드 실패: {fn} ({e})")
-                else:
-                    _log_console(f"[generator] Failed to load DLL: {fn} ({e})")
-    else:
-        il2cpp_path = os.path.join(game_path, "GameAssembly.dll")
-        with open(il2cpp_path, "rb") as f:
-            il2cpp = f.read()
+        cache_key += (_managed_dll_signature(data_path),)
+    cached = _GENERATOR_CACHE.get(cache_key)
+    if cached is not None:
+        _GENERATOR_CACHE.move_to_end(cache_key)
+        return cached
+
+    generator = _build_generator(
+        unity_version, game_path, data_path, compile_method, lang=lang
+    )
+    _GENERATOR_CACHE[cache_key] = generator
+    while len(_GENERATOR_CACHE) > _GENERATOR_CACHE_MAX:
+        _GENERATOR_CACHE.popitem(last=False)
+    return generator
+
+
+def _build_generator(
+    unity_version: str,
+    game_path: str,
+    data_path: str,
+    compile_method: str,
+    lang: Language = "ko",
+) -> TypeTreeGenerator:
+    """KR: 캐시 없이 타입트리 생성기를 새로 만들고 메타데이터를 로드합니다.
+    EN: Builds a new TypeTree generator without caching and loads metadata.
+    """
+    generator = TypeTreeGenerator(unity_version)
+    if compile_method == "Mono":
+        managed_dir = os.path.join(data_path, "Managed")
+        with os.scandir(managed_dir) as it:
+            dll_entries = [
+                entry for entry in it if entry.name.endswith(".dll") and entry.is_file()
+            ]
+        for entry in dll_entries:
+            fn = entry.name
+            try:
+                with _open_readonly_mmap(entry.path) as dll_data:
+                    _call_with_buffer_fallback(generator.load_dll, dll_data)
+            except Exception as e:
+                if lang == "ko":
+                    _log_console(f"[generator] DLL 로드 실패: {fn} ({e})")
+                else:
+                    _log_console(f"[generator] Failed to load DLL: {fn} ({e})")
+    else:
+        il2cpp_path = os.path.join(game_path, "GameAssembly.dll")
         metadata_path = os.path.join(
             data_path, "il2cpp_data", "Metadata", "global-metadata.dat"
         )
-        with open(metadata_path, "rb") as f:
-            metadata = f.read()
-        generator.load_il2cpp(il2cpp, metadata)
+        with _open_readonly_mmap(il2cpp_path) as il2cpp, _open_readonly_mmap(
+            metadata_path
+        ) as metadata:
+            _call_with_buffer_fallback(generator.load_il2cpp, il2cpp, metadata)
     return generator
 
 
+def _open_readonly_mmap(path: str) -> mmap.mmap:
+    """KR: 파일을 읽기 전용 mmap으로 엽니다. 빈 파일은 mmap할 수 없으므로 ValueError가 납니다.
+    EN: Opens a file as a read-only mmap. Empty files cannot be mapped and raise ValueError.
+    """
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _call_with_buffer_fallback(func: Callable[..., Any], *buffers: mmap.mmap) -> Any:
+    """KR: mmap 버퍼를 그대로 넘겨 복사를 피하고, bytes만 받는 바인딩이면 bytes로 재시도합니다.
+    EN: Passes mmap buffers directly to avoid a copy; retries with bytes for bindings that only accept bytes.
+    """
+    try:
+        return func(*buffers)
+    except TypeError:
+        return func(*(bytes(buf) for buf in buffers))
+
+
+def _peek_monobehaviour_script_key(obj: Any) -> tuple[str, int, int] | None:
+    """KR: MonoBehaviour의 m_Script PPtr를 전체 파싱 없이 헤더에서 읽어 (assets 이름, FileID, PathID)로 반환합니다.
+    읽을 수 없으면 None을 반환하며, 리더 위치는 항상 원래대로 되돌립니다.
+    EN: Reads a MonoBehaviour's m_Script PPtr from its header without a full parse, as (assets name, FileID, PathID).
+    Returns None when it cannot be read; the reader position is always restored.
+    """
+    try:
+        reader = obj.reader
+        saved_position = reader.Position
+        try:
+            reader.Position = obj.byte_start
+            # KR: m_GameObject(PPtr), m_Enabled(bool + 4바이트 정렬), m_Script(PPtr) 순서입니다.
+            # EN: Layout is m_GameObject (PPtr), m_Enabled (bool + 4-byte align), m_Script (PPtr).
+            wide_path_id = int(obj.assets_file.header.version) >= 14
+            reader.read_int()
+            if wide_path_id:
+                reader.read_long()
+            else:
+                reader.read_int()
+            reader.read_boolean()
+            reader.align_stream()
+            script_file_id = int(reader.read_int())
+            script_path_id = int(
+                reader.read_long() if wide_path_id else reader.read_int()
+            )
+        finally:
+            reader.Position = saved_position
+    except Exception:
+        return None
+    return str(obj.assets_file.name), script_file_id, script_path_id
+
+
 def _scan_fonts_from_env(
     env: Any,
     file_name: str,
@@ -6010,6 +6665,11 @@ def _scan_fonts_from_env(
     scanned: dict[str, list[JsonDict]] = {"ttf": [], "sdf": []}
     texture_lookup: dict[tuple[str, int], Any] = {}
     texture_swizzle_cache: dict[str, str | None] = {}
+    # KR: TMP 여부는 필드 구성(클래스)으로 정해지므로, 한 번 TMP가 아니라고 판정된 스크립트의
+    #     다른 MonoBehaviour는 전체 파싱 없이 건너뜁니다.
+    # EN: TMP-ness is decided by field layout (the class), so other MonoBehaviours of a script
+    #     already judged non-TMP are skipped without a full parse.
+    non_tmp_script_keys: set[tuple[str, int, int]] = set()
     if detect_ps5_swizzle:
         for item in env.objects:
             if item.type.name != "Texture2D":
@@ -6018,7 +6678,8 @@ def _scan_fonts_from_env(
 
     for obj in env.objects:
         try:
-            if obj.type.name == "Font":
+            type_name = obj.type.name
+            if type_name == "Font":
                 font_name = obj.peek_name()
                 if not font_name:
                     try:
@@ -6034,13 +6695,21 @@ def _scan_fonts_from_env(
                         "path_id": obj.path_id,
                     }
                 )
-            elif obj.type.name == "MonoBehaviour":
-                parse_dict = None
+            elif type_name == "MonoBehaviour":
                 atlas_file_id = 0
                 atlas_path_id = 0
                 glyph_count = 0
+                script_key = _peek_monobehaviour_script_key(obj)
+                if script_key is not None and script_key in non_tmp_script_keys:
+                    continue
                 try:
                     parse_dict = obj.parse_as_dict()
+                    # KR: 신호 키가 하나도 없으면 스키마 판별(버전 힌트 조회 포함)을 건너뜁니다.
+                    # EN: Skip schema inspection (including the version hint lookup) when no signal key exists.
+                    if _TMP_SCHEMA_SIGNAL_KEYS.isdisjoint(parse_dict):
+                        if script_key is not None:
+                            non_tmp_script_keys.add(script_key)
+                        continue
                     unity_version_hint = getattr(obj.assets_file, "unity_version", None)
                     tmp_info = inspect_tmp_font_schema(
                         parse_dict,
@@ -6049,6 +6718,10 @@ def _scan_fonts_from_env(
                         ),
                     )
                 except Exception:
+                    # KR: 디버그가 꺼져 있으면 메시지 문자열도 만들지 않습니다.
+                    # EN: Do not even build the message string when debug is off.
+                    if not debug_parse_enabled():
+                        continue
                     if lang == "ko":
                         debug_parse_log(
                             f"[scan_fonts] parse_as_dict 실패: {file_name} | PathID {obj.path_id}"
@@ -6060,11 +6733,13 @@ def _scan_fonts_from_env(
                     continue
 
                 if not tmp_info.get("is_tmp"):
+                    if script_key is not None:
+                        non_tmp_script_keys.add(script_key)
                     continue
 
+                # KR: 아래 검사는 위에서 한 번 파싱한 tmp_info만 사용하며 재파싱하지 않습니다.
+                # EN: The checks below only use tmp_info from the single parse above; no re-parse.
                 try:
-                    if parse_dict is None:
-                        parse_dict = obj.parse_as_dict()
                     glyph_count = int(tmp_info.get("glyph_count", 0) or 0)
                     atlas_file_id = int(tmp_info.get("atlas_file_id", 0) or 0)
                     atlas_path_id = int(tmp_info.get("atlas_path_id", 0) or 0)
@@ -6075,6 +6750,8 @@ def _scan_fonts_from_env(
                     if glyph_count == 0:
                         continue
                 except Exception:
+                    if not debug_parse_enabled():
+                        continue
                     if lang == "ko":
                         debug_parse_log(
                             f"[scan_fonts] SDF 필드 검사 실패: {file_name} | PathID {obj.path_id}"
@@ -6127,12 +6804,15 @@ def _scan_fonts_from_env(
 
 def _scan_fonts_in_asset_file(
     assets_file: str,
-    generator: TypeTreeGenerator,
+    generator: TypeTreeGenerator | None,
     lang: Language = "ko",
     detect_ps5_swizzle: bool = False,
+    generator_factory: Callable[[], TypeTreeGenerator] | None = None,
 ) -> tuple[dict[str, list[JsonDict]], str | None]:
     """KR: 단일 에셋 파일을 로드해 폰트 정보를 추출합니다.
+    generator 대신 generator_factory를 주면 MonoBehaviour가 있는 파일에서만 생성기를 만듭니다.
     EN: Loads a single asset file and extracts font information.
+    If generator_factory is given instead of generator, the generator is built only for files with MonoBehaviours.
     """
     file_name = os.path.basename(assets_file)
     scanned: dict[str, list[JsonDict]] = {"ttf": [], "sdf": []}
@@ -6140,13 +6820,18 @@ def _scan_fonts_in_asset_file(
     env = None
     try:
         env = UnityPy.load(assets_file)
-        env.typetree_generator = generator
     except Exception as e:
         if lang == "ko":
             return scanned, f"UnityPy.load 실패: {assets_file} ({e})"
         return scanned, f"UnityPy.load failed: {assets_file} ({e})"
 
     try:
+        if generator is None and generator_factory is not None:
+            mono_behaviour_class = ClassIDType.MonoBehaviour
+            if any(obj.type is mono_behaviour_class for obj in env.objects):
+                generator = generator_factory()
+        if generator is not None:
+            env.typetree_generator = generator
         scanned = _scan_fonts_from_env(
             env, file_name, lang=lang, detect_ps5_swizzle=detect_ps5_swizzle
         )
@@ -6163,9 +6848,12 @@ def _scan_fonts_via_worker(
     assets_file: str,
     lang: Language = "ko",
     detect_ps5_swizzle: bool = False,
+    unity_version: str | None = None,
 ) -> tuple[dict[str, list[JsonDict]], str | None]:
     """KR: 파일 단위 서브프로세스 워커로 스캔해 크래시를 격리합니다.
+    unity_version을 넘기면 워커가 globalgamemanagers를 다시 읽지 않습니다.
     EN: Scans via a per-file subprocess worker to isolate crashes.
+    When unity_version is given, the worker skips re-reading globalgamemanagers.
     """
     fd, output_path = tempfile.mkstemp(prefix="scan_worker_", suffix=".json")
     os.close(fd)
@@ -6207,6 +6895,8 @@ def _scan_fonts_via_worker(
                 ]
             if detect_ps5_swizzle:
                 cmd.append("--ps5-swizzle")
+            if unity_version:
+                cmd.extend(["--_scan-file-worker-unity-version", unity_version])
 
             proc = subprocess.run(
                 cmd,
@@ -6249,8 +6939,7 @@ def _scan_fonts_via_worker(
                     None,
                 )
 
-            with open(output_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = _read_json_file(output_path)
             scanned = {
                 "ttf": list(payload.get("ttf", []))
                 if isinstance(payload, dict)
@@ -6333,17 +7022,23 @@ def scan_fonts(
     If scan_jobs>1, runs workers in parallel on the isolate_files path.
     """
     data_path = get_data_path(game_path, lang=lang)
-    unity_version = get_unity_version(game_path, lang=lang)
     assets_files = find_assets_files(
         game_path,
         lang=lang,
         target_files=target_files,
         exclude_exts=exclude_exts,
     )
-    compile_method = get_compile_method(data_path)
-    generator = _create_generator(
-        unity_version, game_path, data_path, compile_method, lang=lang
-    )
+    # KR: 격리 워커는 각 프로세스에서 생성기를 만들므로, 인프로세스 스캔일 때만 부모에서 생성합니다.
+    #     Unity 버전은 여기서 한 번만 감지해 워커에 넘겨, 워커마다 globalgamemanagers를 다시 로드하지 않게 합니다.
+    # EN: Isolated workers build their own generator, so only build one here for in-process scans.
+    #     Detect the Unity version once here and pass it down so each worker does not reload globalgamemanagers.
+    generator: TypeTreeGenerator | None = None
+    unity_version = get_unity_version(game_path, lang=lang)
+    if not isolate_files:
+        compile_method = get_compile_method(data_path)
+        generator = _create_generator(
+            unity_version, game_path, data_path, compile_method, lang=lang
+        )
 
     fonts: dict[str, list[JsonDict]] = {
         "ttf": [],
@@ -6392,6 +7087,7 @@ def scan_fonts(
                     assets_file,
                     lang,
                     ps5_swizzle,
+                    unity_version,
                 ): (idx, os.path.basename(assets_file), assets_file)
                 for idx, assets_file in enumerate(assets_files)
             }
@@ -6439,6 +7135,7 @@ def scan_fonts(
                     assets_file,
                     lang=lang,
                     detect_ps5_swizzle=ps5_swizzle,
+                    unity_version=unity_version,
                 )
                 previous_scanned, previous_error, _ = indexed_results.get(
                     idx, ({"ttf": [], "sdf": []}, None, fn)
@@ -6493,6 +7190,7 @@ def scan_fonts(
                     assets_file,
                     lang=lang,
                     detect_ps5_swizzle=ps5_swizzle,
+                    unity_version=unity_version,
                 )
                 if worker_error:
                     if lang == "ko":
@@ -6508,7 +7206,7 @@ def scan_fonts(
 
             scanned, load_error = _scan_fonts_in_asset_file(
                 assets_file,
-                generator,
+                cast(TypeTreeGenerator, generator),
                 lang=lang,
                 detect_ps5_swizzle=ps5_swizzle,
             )
@@ -6522,6 +7220,12 @@ def scan_fonts(
     return fonts
 
 
+# KR: parse 결과 JSON은 사람이 편집하므로 indent=4 형식을 유지하고 인코더는 재사용합니다.
+# EN: Parse-result JSON is hand-edited, so keep the indent=4 layout and reuse one encoder.
+_PARSE_RESULT_JSON_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+_JSON_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
 def parse_fonts(
     game_path: str,
     lang: Language = "ko",
@@ -6600,8 +7304,12 @@ def parse_fonts(
             }
         result[key] = entry
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=4, ensure_ascii=False)
+    # KR: 전체 문자열을 만들지 않고 공유 인코더의 청크를 큰 버퍼로 바로 기록합니다.
+    # EN: Write chunks from the shared encoder through a large buffer without building the whole string.
+    with open(
+        output_file, "w", encoding="utf-8", buffering=_JSON_WRITE_BUFFER_SIZE
+    ) as f:
+        f.writelines(_PARSE_RESULT_JSON_ENCODER.iterencode(result))
 
     if lang == "ko":
         _log_console(f"폰트 정보가 '{output_file}'에 저장되었습니다.")
@@ -6670,14 +7378,18 @@ def _build_font_asset_name_candidates(
 
 
 _BULK_SDF_PADDING_VARIANTS = (5, 7, 15)
+_BULK_SDF_PADDING_FONT_NAMES = frozenset(("nanumgothic", "mulmaru"))
 
 
+# KR: SDF 대상마다 호출되지만 (교체 폰트, 원본 padding) 조합은 몇 개뿐이므로 결과를 캐시합니다.
+# EN: Called per SDF target, but there are only a few (replacement font, source padding) pairs, so cache results.
+@lru_cache(maxsize=256)
 def _select_builtin_bulk_padding_variant(
     normalized: str,
     source_padding: float | int | None,
 ) -> int | None:
     base_name = normalize_font_name(normalized).strip().lower()
-    if base_name not in {"nanumgothic", "mulmaru"}:
+    if base_name not in _BULK_SDF_PADDING_FONT_NAMES:
         return None
     try:
         numeric_padding = float(source_padding) if source_padding is not None else 0.0
@@ -6711,10 +7423,11 @@ def _find_replacement_sdf_atlas_path(
     _, name_candidates = _build_font_asset_name_candidates(
         normalized, bool(prefer_raster)
     )
+    kr_asset_names = _dir_file_names(kr_assets)
     for name_candidate in name_candidates:
-        atlas_path = os.path.join(kr_assets, f"{name_candidate} Atlas.png")
-        if os.path.exists(atlas_path):
-            return atlas_path
+        atlas_name = f"{name_candidate} Atlas.png"
+        if os.path.normcase(atlas_name) in kr_asset_names:
+            return os.path.join(kr_assets, atlas_name)
     return None
 
 
@@ -6793,7 +7506,83 @@ def _estimate_sdf_texture_batch_profile(
     }
 
 
-@lru_cache(maxsize=64)
+# KR: 교체 폰트 리소스 캐시. 항목 수와 대략적인 바이트 합계 두 예산으로 LRU를 제한합니다.
+# EN: Replacement font resource cache, LRU-bounded by both entry count and approximate total bytes.
+_FONT_ASSET_CACHE_MAX_ENTRIES = 16
+_FONT_ASSET_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# KR: 캐시 적중 시 원본 파일을 다시 stat하는 최소 간격(초). 대량 교체에서 같은 폰트를 연달아 쓸 때 stat 반복을 줄입니다.
+# EN: Minimum interval (seconds) between source re-stats on cache hits; bulk runs reuse one font back to back.
+_FONT_ASSET_CACHE_RECHECK_SEC = 2.0
+_FONT_ASSET_CACHE: OrderedDict[
+    tuple[str, str, bool, int | None],
+    tuple[JsonDict, tuple[tuple[str, int, int], ...], int, float],
+] = OrderedDict()
+_font_asset_cache_bytes = 0
+# KR: 폰트 캐시에는 Atlas PNG 경로만 두고, 디코드된 Atlas는 항목 수/픽셀 바이트 예산 안에서 별도로 유지합니다.
+#     패딩 변형 등으로 한 파일이 여러 Atlas를 쓰더라도 파일마다 PNG를 다시 디코드하지 않도록 합니다.
+# EN: The font cache keeps only the atlas PNG path; decoded atlases are kept separately within entry/pixel-byte budgets,
+#     so a file that uses several atlases (e.g. padding variants) does not re-decode PNGs for every file.
+_DECODED_ATLAS_CACHE_MAX_ENTRIES = 8
+_DECODED_ATLAS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_DECODED_ATLAS_CACHE: OrderedDict[tuple[str, int, int], tuple[Image.Image, int]] = (
+    OrderedDict()
+)
+_decoded_atlas_cache_bytes = 0
+
+
+def _stat_signature(paths: Iterable[str]) -> tuple[tuple[str, int, int], ...]:
+    """KR: 파일 목록의 (경로, mtime, 크기) 서명을 반환합니다. 없는 파일은 (-1, -1)입니다.
+    EN: Returns a (path, mtime, size) signature for files; missing files map to (-1, -1).
+    """
+    signature: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((path, -1, -1))
+    return tuple(signature)
+
+
+def _decode_atlas_file(atlas_path: str) -> Image.Image:
+    """KR: Atlas PNG를 디코드합니다. 같은 (경로, mtime, 크기)는 캐시 예산 안에서 디코드 결과를 재사용합니다.
+    EN: Decodes an atlas PNG, reusing the decoded image for (path, mtime, size) keys within the cache budgets.
+    """
+    global _decoded_atlas_cache_bytes
+    st = os.stat(atlas_path)
+    decode_key = (atlas_path, st.st_mtime_ns, st.st_size)
+    cached = _DECODED_ATLAS_CACHE.get(decode_key)
+    if cached is not None:
+        _DECODED_ATLAS_CACHE.move_to_end(decode_key)
+        return cached[0]
+    with open(atlas_path, "rb") as f:
+        atlas = Image.open(f)
+        atlas.load()
+    atlas_bytes = atlas.width * atlas.height * len(atlas.getbands())
+    _DECODED_ATLAS_CACHE[decode_key] = (atlas, atlas_bytes)
+    _decoded_atlas_cache_bytes += atlas_bytes
+    # KR: 방금 디코드한 Atlas는 예산을 넘어도 유지합니다.
+    # EN: Always keep the atlas just decoded, even over budget.
+    while len(_DECODED_ATLAS_CACHE) > 1 and (
+        len(_DECODED_ATLAS_CACHE) > _DECODED_ATLAS_CACHE_MAX_ENTRIES
+        or _decoded_atlas_cache_bytes > _DECODED_ATLAS_CACHE_MAX_BYTES
+    ):
+        _, (_, evicted_bytes) = _DECODED_ATLAS_CACHE.popitem(last=False)
+        _decoded_atlas_cache_bytes -= evicted_bytes
+    return atlas
+
+
+def _clear_font_assets_cache() -> None:
+    """KR: 교체 폰트 리소스 캐시와 디코딩된 아틀라스 캐시를 비웁니다.
+    EN: Clears the replacement font resource cache and the decoded atlas cache.
+    """
+    global _font_asset_cache_bytes, _decoded_atlas_cache_bytes
+    _FONT_ASSET_CACHE.clear()
+    _DECODED_ATLAS_CACHE.clear()
+    _font_asset_cache_bytes = 0
+    _decoded_atlas_cache_bytes = 0
+
+
 def _load_font_assets_cached(
     script_dir: str,
     normalized: str,
@@ -6801,24 +7590,163 @@ def _load_font_assets_cached(
     padding_variant: int | None = None,
 ) -> JsonDict:
     """KR: KR_ASSETS에서 폰트 리소스를 읽어 캐시에 저장합니다.
+    원본 파일의 mtime/크기가 바뀌면 다시 읽고(확인은 최대 _FONT_ASSET_CACHE_RECHECK_SEC마다 한 번),
+    항목 수/바이트 예산을 넘으면 오래된 항목부터 제거합니다.
     EN: Reads font resources from KR_ASSETS and stores them in cache.
+    Reloads when source file mtime/size changes (checked at most once per _FONT_ASSET_CACHE_RECHECK_SEC)
+    and evicts least-recently-used entries over the count/byte budgets.
+    """
+    global _font_asset_cache_bytes
+    cache_key = (script_dir, normalized, bool(prefer_raster), padding_variant)
+    cached = _FONT_ASSET_CACHE.get(cache_key)
+    now = time.monotonic()
+    if cached is not None:
+        assets, signature, entry_bytes, checked_at = cached
+        if now - checked_at < _FONT_ASSET_CACHE_RECHECK_SEC:
+            _FONT_ASSET_CACHE.move_to_end(cache_key)
+            return assets
+        if _stat_signature(path for path, _, _ in signature) == signature:
+            _FONT_ASSET_CACHE[cache_key] = (assets, signature, entry_bytes, now)
+            _FONT_ASSET_CACHE.move_to_end(cache_key)
+            return assets
+        del _FONT_ASSET_CACHE[cache_key]
+        _font_asset_cache_bytes -= entry_bytes
+
+    assets, source_paths = _read_font_assets(
+        script_dir, normalized, bool(prefer_raster), padding_variant
+    )
+    signature = _stat_signature(source_paths)
+    # KR: Atlas는 디코드하지 않고 경로만 두므로 원본 파일 크기 합계로 예산을 계산합니다.
+    # EN: Atlases are kept as paths, not decoded, so the budget uses the source file sizes.
+    entry_bytes = sum(max(0, size) for _, _, size in signature)
+    _FONT_ASSET_CACHE[cache_key] = (assets, signature, entry_bytes, time.monotonic())
+    _font_asset_cache_bytes += entry_bytes
+    # KR: 방금 넣은 항목은 예산을 넘어도 유지해 같은 폰트의 반복 로드를 막습니다.
+    # EN: Always keep the newest entry, even over budget, so the same font is not reloaded repeatedly.
+    while len(_FONT_ASSET_CACHE) > 1 and (
+        len(_FONT_ASSET_CACHE) > _FONT_ASSET_CACHE_MAX_ENTRIES
+        or _font_asset_cache_bytes > _FONT_ASSET_CACHE_MAX_BYTES
+    ):
+        _, (_, _, evicted_bytes, _) = _FONT_ASSET_CACHE.popitem(last=False)
+        _font_asset_cache_bytes -= evicted_bytes
+    return assets
+
+
+# KR: 이 크기 이상의 JSON은 orjson에 mmap 버퍼를 그대로 넘겨 파일 전체 bytes 복사를 피합니다.
+# EN: JSON at or above this size is handed to orjson as an mmap buffer, avoiding a full bytes copy.
+_JSON_MMAP_MIN_BYTES = 4 * 1024 * 1024
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _read_json_file(path: str) -> Any:
+    """KR: JSON 파일을 읽습니다. orjson이 있으면 대형 SDF JSON을 더 빠르게 파싱하고,
+    orjson이 거부하는 입력(NaN, 64비트 초과 정수 등)은 표준 json으로 폴백합니다.
+    EN: Reads a JSON file. Uses orjson for faster parsing of large SDF JSON when available,
+    falling back to the standard json module for input orjson rejects (NaN, >64-bit ints, etc.).
+    """
+    if orjson is not None:
+        try:
+            file_size = os.path.getsize(path)
+        except OSError:
+            file_size = 0
+        if file_size >= _JSON_MMAP_MIN_BYTES:
+            with _open_readonly_mmap(path) as mm:
+                start = len(_UTF8_BOM) if mm[: len(_UTF8_BOM)] == _UTF8_BOM else 0
+                with memoryview(mm)[start:] as view:
+                    try:
+                        return orjson.loads(view)
+                    except ValueError:
+                        pass
+    with open(path, "rb") as f:
+        raw = f.read()
+    # KR: 메모장 등으로 편집한 --list JSON의 UTF-8 BOM은 orjson/json 모두 거부하므로 미리 제거합니다.
+    # EN: Both orjson and json reject the UTF-8 BOM that editors like Notepad add to --list JSON, so strip it first.
+    if raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM):]
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _contains_non_finite_float(value: Any) -> bool:
+    """KR: 값(중첩 dict/list/tuple, dict 키 포함)에 NaN/Infinity float가 있는지 확인합니다.
+    EN: Checks whether a value (nested dicts/lists/tuples, dict keys included) holds a NaN/Infinity float.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _write_json_file(path: str, payload: Any) -> None:
+    """KR: 기계가 읽는 JSON을 압축 형식으로 씁니다. orjson이 있으면 bytes로 바로 직렬화하고,
+    orjson이 거부하는 값(64비트 초과 정수 등)은 표준 json으로 폴백합니다.
+    orjson은 NaN/Infinity를 오류 없이 null로 바꾸므로, 그런 값이 있으면 표준 json으로 NaN/Infinity를 그대로 씁니다.
+    EN: Writes machine-read JSON in compact form. Serializes straight to bytes with orjson when available,
+    falling back to the standard json module for values orjson rejects (>64-bit ints, etc.).
+    orjson silently turns NaN/Infinity into null, so payloads holding them go through json, which writes NaN/Infinity as-is.
+    """
+    if orjson is not None and not _contains_non_finite_float(payload):
+        try:
+            raw = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(raw)
+            return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+def _read_font_assets(
+    script_dir: str,
+    normalized: str,
+    prefer_raster: bool = False,
+    padding_variant: int | None = None,
+) -> tuple[JsonDict, list[str]]:
+    """KR: 캐시 없이 KR_ASSETS에서 폰트 리소스를 읽고, 사용한 원본 파일 경로 목록을 함께 반환합니다.
+    EN: Reads font resources from KR_ASSETS without caching and also returns the source file paths used.
     """
+    source_paths: list[str] = []
     kr_assets = os.path.join(script_dir, "KR_ASSETS")
     asset_roots = _iter_kr_asset_roots(kr_assets, padding_variant=padding_variant)
+    # KR: 후보마다 os.path.exists를 호출하지 않고 폴더별 파일명 집합으로 존재 여부를 확인합니다.
+    # EN: Check existence against per-folder file name sets instead of calling os.path.exists per candidate.
+    root_names = {asset_root: _dir_file_names(asset_root) for asset_root in asset_roots}
+    normcase = os.path.normcase
     font_name_candidates, name_candidates = _build_font_asset_name_candidates(
         normalized,
         bool(prefer_raster),
     )
 
-    ttf_data = None
+    # KR: TTF는 mmap으로 열어 실제로 교체에 쓰일 때만 페이지가 올라오게 합니다.
+    # EN: TTFs are mmapped so pages are only brought in when a font is actually used for replacement.
+    ttf_data: mmap.mmap | bytes | None = None
     for font_name in font_name_candidates:
         for ext in (".ttf", ".otf"):
             for asset_root in asset_roots:
-                font_path = os.path.join(asset_root, f"{font_name}{ext}")
-                if os.path.exists(font_path):
-                    with open(font_path, "rb") as f:
-                        ttf_data = f.read()
-                    break
+                file_name = f"{font_name}{ext}"
+                if normcase(file_name) not in root_names[asset_root]:
+                    continue
+                font_path = os.path.join(asset_root, file_name)
+                try:
+                    ttf_data = _open_readonly_mmap(font_path)
+                except ValueError:
+                    ttf_data = b""
+                source_paths.append(font_path)
+                break
             if ttf_data is not None:
                 break
         if ttf_data is not None:
@@ -6826,69 +7754,96 @@ def _load_font_assets_cached(
 
     sdf_data = None
     sdf_data_normalized = None
+    sdf_glyph_indexes: tuple[int, ...] | None = None
+    sdf_glyph_by_index: dict[int, JsonDict] | None = None
     sdf_swizzle = False
     sdf_process_swizzle = False
     for name_candidate in name_candidates:
         for asset_root in asset_roots:
-            sdf_json_path = os.path.join(asset_root, f"{name_candidate}.json")
-            if not os.path.exists(sdf_json_path):
+            file_name = f"{name_candidate}.json"
+            if normcase(file_name) not in root_names[asset_root]:
                 continue
-            with open(sdf_json_path, "r", encoding="utf-8") as f:
-                sdf_data = json.load(f)
+            sdf_json_path = os.path.join(asset_root, file_name)
+            sdf_data = _read_json_file(sdf_json_path)
+            source_paths.append(sdf_json_path)
             if isinstance(sdf_data, dict):
-                sdf_data_normalized = normalize_sdf_data(sdf_data, deep_copy=True)
                 sdf_swizzle = parse_bool_flag(sdf_data.get("swizzle"))
                 sdf_process_swizzle = parse_bool_flag(sdf_data.get("process_swizzle"))
+                # KR: 방금 읽은 JSON은 다른 곳과 공유되지 않으므로 복사 없이 제자리 정규화해
+                # KR: 폰트당 한 번만 만든 템플릿을 모든 교체 대상이 공유합니다.
+                # EN: The freshly parsed JSON is not shared, so normalize it in place without copying;
+                # EN: every replacement target then shares this once-per-font template.
+                sdf_data_normalized = normalize_sdf_data(sdf_data, deep_copy=False)
+                # KR: 글리프 인덱스 목록과 m_Index 색인도 폰트당 한 번만 만들어 대상마다 다시 순회하지 않습니다.
+                # EN: Build the glyph index list and m_Index lookup once per font so targets do not re-walk the glyph table.
+                normalized_glyphs = sdf_data_normalized.get("m_GlyphTable")
+                if isinstance(normalized_glyphs, list):
+                    sdf_glyph_by_index = {}
+                    glyph_indexes: list[int] = []
+                    for glyph in normalized_glyphs:
+                        if isinstance(glyph, dict):
+                            index = int(glyph.get("m_Index", 0) or 0)
+                            glyph_indexes.append(index)
+                            sdf_glyph_by_index[index] = glyph
+                    sdf_glyph_indexes = tuple(glyph_indexes)
             break
         if sdf_data is not None:
             break
 
-    sdf_atlas = None
+    # KR: Atlas는 경로만 기록하고 load_font_assets에서 필요할 때 디코드합니다.
+    # EN: Only record the atlas path; load_font_assets decodes it on demand.
+    sdf_atlas_path: str | None = None
     for name_candidate in name_candidates:
         for asset_root in asset_roots:
-            sdf_atlas_path = os.path.join(asset_root, f"{name_candidate} Atlas.png")
-            if not os.path.exists(sdf_atlas_path):
+            file_name = f"{name_candidate} Atlas.png"
+            if normcase(file_name) not in root_names[asset_root]:
                 continue
-            with open(sdf_atlas_path, "rb") as f:
-                sdf_atlas = Image.open(f)
-                sdf_atlas.load()
+            sdf_atlas_path = os.path.join(asset_root, file_name)
+            source_paths.append(sdf_atlas_path)
             break
-        if sdf_atlas is not None:
+        if sdf_atlas_path is not None:
             break
 
     sdf_material_data = None
     for name_candidate in name_candidates:
         for asset_root in asset_roots:
-            sdf_material_path = os.path.join(
-                asset_root, f"{name_candidate} Material.json"
-            )
-            if not os.path.exists(sdf_material_path):
+            file_name = f"{name_candidate} Material.json"
+            if normcase(file_name) not in root_names[asset_root]:
                 continue
-            with open(sdf_material_path, "r", encoding="utf-8") as f:
-                sdf_material_data = json.load(f)
+            sdf_material_path = os.path.join(asset_root, file_name)
+            sdf_material_data = _read_json_file(sdf_material_path)
+            source_paths.append(sdf_material_path)
             break
         if sdf_material_data is not None:
             break
 
-    return {
+    assets: JsonDict = {
         "ttf_data": ttf_data,
         "sdf_data": sdf_data,
         "sdf_data_normalized": sdf_data_normalized,
-        "sdf_atlas": sdf_atlas,
+        "sdf_glyph_indexes": sdf_glyph_indexes,
+        "sdf_glyph_by_index": sdf_glyph_by_index,
+        "sdf_atlas_path": sdf_atlas_path,
         "sdf_materials": sdf_material_data,
         "sdf_swizzle": sdf_swizzle,
         "sdf_process_swizzle": sdf_process_swizzle,
         "padding_variant": int(padding_variant) if padding_variant is not None else None,
     }
+    return assets, source_paths
 
 
 def load_font_assets(
     font_name: str,
     prefer_raster: bool = False,
     padding_variant: int | None = None,
+    decode_atlas: bool = True,
 ) -> JsonDict:
     """KR: 지정 폰트명의 교체용 리소스(TTF/SDF/Atlas/Material)를 로드합니다.
+    decode_atlas=False면 Atlas PNG를 디코드하지 않고 sdf_atlas를 None으로 둡니다 (TTF 전용 경로).
+    SDF JSON이 없으면 어차피 교체가 건너뛰어지므로 Atlas도 디코드하지 않습니다.
     EN: Loads replacement resources (TTF/SDF/Atlas/Material) for the specified font name.
+    decode_atlas=False skips decoding the atlas PNG and leaves sdf_atlas as None (TTF-only path).
+    The atlas is also left undecoded when the SDF JSON is missing, since that replacement is skipped anyway.
     """
     normalized = normalize_font_name(font_name)
     cached_assets = _load_font_assets_cached(
@@ -6897,14 +7852,26 @@ def load_font_assets(
         bool(prefer_raster),
         int(padding_variant) if padding_variant is not None else None,
     )
-    atlas = cached_assets["sdf_atlas"]
+    atlas_path = cached_assets["sdf_atlas_path"]
+    atlas = (
+        _decode_atlas_file(atlas_path)
+        if decode_atlas
+        and atlas_path is not None
+        and cached_assets["sdf_data"] is not None
+        else None
+    )
     return {
         "ttf_data": cached_assets["ttf_data"],
         "sdf_data": cached_assets["sdf_data"],
         "sdf_data_normalized": cached_assets.get("sdf_data_normalized"),
-        # KR: 캐시된 atlas 객체를 재사용하여 교체 시 이미지 중복 생성을 방지합니다.
-    # EN: Reuses cached atlas objects to prevent duplicate image creation during replacement.
+        "sdf_glyph_indexes": cached_assets.get("sdf_glyph_indexes"),
+        "sdf_glyph_by_index": cached_assets.get("sdf_glyph_by_index"),
+        # KR: 캐시된 atlas 객체를 복사 없이 공유합니다. 호출부는 이 이미지를 제자리 수정하면 안 되며,
+        # KR: swizzle/리사이즈 등은 항상 새 이미지를 반환하는 경로만 사용합니다.
+        # EN: Shares the cached atlas object without copying. Callers must not mutate it in place;
+        # EN: swizzle/resize paths always return a new image.
         "sdf_atlas": atlas,
+        "sdf_atlas_path": atlas_path,
         "sdf_materials": cached_assets["sdf_materials"],
         "sdf_swizzle": cached_assets.get("sdf_swizzle"),
         "sdf_process_swizzle": bool(cached_assets.get("sdf_process_swizzle", False)),
@@ -7219,6 +8186,134 @@ def _binary_patch_texture2d(
     return True
 
 
+def _write_blob_file(path: str, blob: bytes) -> None:
+    """KR: 저장 blob을 버퍼 없는 파일 핸들로 기록합니다. 중간 BufferedWriter 없이
+    큰 write 호출로 바로 내려보내고, 부분 기록이 생기면 남은 부분만 이어서 씁니다.
+    EN: Writes a save blob through an unbuffered file handle. Large writes go straight to the OS
+    without an intermediate BufferedWriter, continuing with the remainder on partial writes.
+    """
+    view = memoryview(blob)
+    with open(path, "wb", buffering=0) as f:
+        while view:
+            written = f.write(view)
+            view = view[written:]
+
+
+# KR: 다음 파일 미리 읽기 상한. 이보다 큰 파일은 페이지 캐시에 다 담기지 않을 수 있어 건너뜁니다.
+# EN: Read-ahead ceiling for the next file; larger files may not fit the page cache, so they are skipped.
+_READAHEAD_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _warm_file_cache(path: str) -> None:
+    """KR: 파일을 OS 페이지 캐시로 미리 읽어 다음 UnityPy.load가 디스크를 기다리지 않게 합니다.
+    POSIX에서는 posix_fadvise(WILLNEED)로 커널에 맡기고, 그 외에는 재사용 버퍼로 읽어 버립니다. 실패는 무시합니다.
+    EN: Pre-reads a file into the OS page cache so the next UnityPy.load does not wait on disk.
+    On POSIX this hands off to the kernel via posix_fadvise(WILLNEED); elsewhere it reads into a reused buffer. Failures are ignored.
+    """
+    try:
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= 0 or size > _READAHEAD_MAX_BYTES:
+                return
+            fadvise = getattr(os, "posix_fadvise", None)
+            if fadvise is not None:
+                fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                return
+            buffer = bytearray(1024 * 1024)
+            while f.readinto(buffer):
+                pass
+    except OSError:
+        pass
+
+
+# KR: Linux RAM tmpfs 경로. 무압축 우선 저장은 원본보다 몇 배 커질 수 있으므로 여유 공간을 넉넉히 요구합니다.
+# EN: Linux RAM tmpfs path. Uncompressed-first saves can be several times the source size, so require ample headroom.
+_RAM_TEMP_ROOT = "/dev/shm"
+_RAM_TEMP_SIZE_FACTOR = 4
+_RAM_TEMP_HEADROOM_BYTES = 512 * 1024 * 1024
+
+
+def _select_ram_temp_root(largest_file_bytes: int) -> str | None:
+    """KR: Linux에서 /dev/shm에 충분한 여유가 있으면 그 아래 전용 임시 폴더를 만들어 반환합니다.
+    임시 저장본이 디스크를 거치지 않고, 최종 교체만 _replace_file의 볼륨 간 복사로 디스크에 기록됩니다.
+    조건이 맞지 않으면 None을 반환합니다.
+    EN: On Linux, creates and returns a private temp folder under /dev/shm when it has enough free space.
+    Candidate saves then never touch the disk; only the final swap is written via _replace_file's cross-volume copy.
+    Returns None when the conditions are not met.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        st = os.statvfs(_RAM_TEMP_ROOT)
+    except (OSError, AttributeError):
+        return None
+    free_bytes = st.f_bavail * st.f_frsize
+    required_bytes = (
+        max(0, int(largest_file_bytes)) * _RAM_TEMP_SIZE_FACTOR
+        + _RAM_TEMP_HEADROOM_BYTES
+    )
+    if free_bytes < required_bytes:
+        return None
+    try:
+        return tempfile.mkdtemp(prefix="unity_font_replacer_", dir=_RAM_TEMP_ROOT)
+    except OSError:
+        return None
+
+
+def _replace_file(src_path: str, dst_path: str) -> None:
+    """KR: src 파일로 dst를 교체합니다. 같은 볼륨이면 os.replace로 원자적으로 바꿉니다.
+    볼륨이 다를 때(EXDEV)만 dst 옆 임시 파일로 복사한 뒤 os.replace로 교체하므로,
+    복사 중 디스크 부족/중단이 생겨도 원본은 잘리지 않습니다. 그 외 오류(잠긴 파일 등)는 그대로 올립니다.
+    EN: Replaces dst with the src file. Uses atomic os.replace on the same volume.
+    Only across volumes (EXDEV) does it copy into a temp file next to dst and then os.replace it,
+    so a full disk or interruption mid-copy never truncates the original. Other errors (locked files, etc.) propagate.
+    """
+    try:
+        os.replace(src_path, dst_path)
+        return
+    except OSError as replace_error:
+        if replace_error.errno != errno.EXDEV:
+            raise
+    dst_dir = os.path.dirname(os.path.abspath(dst_path))
+    fd, staging_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(dst_path)}.",
+        suffix=".tmp",
+        dir=dst_dir,
+    )
+    os.close(fd)
+    try:
+        # KR: 커널 복사 fast-path(sendfile/copy_file_range)를 쓰는 shutil.copyfile로 같은 볼륨에 먼저 씁니다.
+        # EN: Write to the same volume first with shutil.copyfile (kernel fast-path: sendfile/copy_file_range).
+        shutil.copyfile(src_path, staging_path)
+        # KR: mkstemp는 0600으로 만들므로 기존 dst의 권한을 옮겨 둡니다. dst가 없으면 src 메타데이터를 따릅니다.
+        # EN: mkstemp creates the file as 0600, so carry over the existing dst mode; without a dst, follow src's metadata.
+        if os.path.exists(dst_path):
+            shutil.copymode(dst_path, staging_path)
+        else:
+            shutil.copystat(src_path, staging_path)
+        os.replace(staging_path, dst_path)
+    except BaseException:
+        try:
+            os.unlink(staging_path)
+        except OSError:
+            pass
+        raise
+    os.unlink(src_path)
+
+
+@lru_cache(maxsize=8)
+def _callable_accepts_packer(func: Callable[..., Any]) -> bool:
+    """KR: save/save_to 함수가 packer 인자를 받는지 시그니처로 한 번만 판별해 캐시합니다.
+    바운드 메서드 대신 __func__를 넘겨 파일 객체마다 캐시 항목이 생기지 않게 합니다.
+    EN: Checks once (cached) whether a save/save_to function accepts a packer argument.
+    Pass __func__ instead of the bound method so each file object does not get its own entry.
+    """
+    try:
+        return "packer" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def replace_fonts_in_file(
     unity_version: str,
     game_path: str,
@@ -7296,9 +8391,18 @@ def replace_fonts_in_file(
     if not os.path.exists(tmp_root):
         os.makedirs(tmp_root, exist_ok=True)
 
-    if os.path.exists(tmp_path):
-        shutil.rmtree(tmp_path)
+    # KR: 스크래치 폴더는 호출마다 지웠다 만들지 않고 재사용하며, 이 파일의 이전 출력만 제거합니다.
+    #     폴더 자체는 종료 시 등록된 임시 폴더 정리에서 삭제됩니다.
+    # EN: Reuse the scratch folder instead of deleting/recreating it per call; only drop this file's stale output.
+    #     The folder itself is removed by the registered temp-dir cleanup at exit.
     os.makedirs(tmp_path, exist_ok=True)
+    stale_tmp_file = os.path.join(tmp_path, fn_without_path)
+    # KR: 존재 확인(stat) 없이 바로 지워 syscall 한 번으로 끝냅니다.
+    # EN: Unlink directly without an existence stat so this is a single syscall.
+    try:
+        os.remove(stale_tmp_file)
+    except FileNotFoundError:
+        pass
     deferred_payload_dir = os.path.join(tmp_root, "deferred_patch_payloads")
     os.makedirs(deferred_payload_dir, exist_ok=True)
 
@@ -7335,7 +8439,7 @@ def replace_fonts_in_file(
     env.typetree_generator = generator
     if replacement_lookup is None:
         replacement_lookup, _ = build_replacement_lookup(replacements)
-    replacement_meta_lookup: dict[tuple[str, str, str, int], JsonDict] = {}
+    replacement_meta_lookup: dict[tuple[str, str, int], JsonDict] = {}
     preview_target_lookup: dict[tuple[str, str, int], JsonDict] = {}
     for info in replacements.values():
         if not isinstance(info, dict):
@@ -7356,24 +8460,25 @@ def replace_fonts_in_file(
             continue
         if type_raw == "SDF":
             preview_target_lookup[(file_raw, assets_raw, path_id)] = info
-        if not info.get("Replace_to"):
+        if not info.get("Replace_to") or file_raw != fn_without_path:
+            continue
+        replacement_meta_lookup[(type_raw, assets_raw, path_id)] = info
+    # KR: 이 파일에 해당하는 항목만 (Type, assets_name, PathID) 키로 미리 추려 객체마다 파일명 비교를 피합니다.
+    #     replacements에 없는 키는 버리므로, 분할 저장 배치가 파일 전체 룩업을 그대로 넘겨도 됩니다.
+    # EN: Pre-filter entries for this file into (Type, assets_name, PathID) keys to skip per-object filename comparisons.
+    #     Keys absent from replacements are dropped, so split-save batches can pass the whole-file lookup as-is.
+    file_replacement_lookup: dict[tuple[str, str, int], str] = {}
+    for key, value in replacement_lookup.items():
+        if len(key) != 4 or key[1] != fn_without_path:
             continue
-        replacement_meta_lookup[(type_raw, file_raw, assets_raw, path_id)] = info
+        file_key = (key[0], key[2], key[3])
+        if file_key in replacement_meta_lookup:
+            file_replacement_lookup[file_key] = value
 
     texture_object_lookup: dict[tuple[str, int], Any] = {}
     texture_swizzle_state_cache: dict[str, tuple[str | None, str | None]] = {}
     material_object_count_by_pathid: dict[int, int] = {}
-    for item in env.objects:
-        item_type = item.type.name
-        if item_type == "Texture2D":
-            texture_object_lookup[(item.assets_file.name, int(item.path_id))] = item
-            continue
-        if item_type == "Material":
-            material_path_id = int(item.path_id)
-            material_object_count_by_pathid[material_path_id] = (
-                material_object_count_by_pathid.get(material_path_id, 0) + 1
-            )
-
+    target_ttf_pathids: set[int] = set()
     target_sdf_targets: set[tuple[str, int]] = set()
     target_sdf_pathids: set[int] = set()
     target_sdf_font_by_target: dict[tuple[str, int], str] = {}
@@ -7384,14 +8489,18 @@ def replace_fonts_in_file(
     material_padding_scale_keys = _MATERIAL_PADDING_SCALE_KEYS
     replacement_padding_limit_warned: set[tuple[str, str, int]] = set()
 
+    if replace_ttf:
+        for key in file_replacement_lookup:
+            if key[0] == "TTF":
+                target_ttf_pathids.add(int(key[2]))
     if replace_sdf:
-        for key, value in replacement_lookup.items():
-            if len(key) == 4 and key[0] == "SDF" and key[1] == fn_without_path:
-                assets_key = key[2]
-                path_id = key[3]
+        for key, value in file_replacement_lookup.items():
+            if key[0] == "SDF":
+                assets_key = key[1]
+                path_id = key[2]
                 target_key = (str(assets_key), int(path_id))
                 target_sdf_targets.add(target_key)
-                target_sdf_pathids.add(path_id)
+                target_sdf_pathids.add(int(path_id))
                 target_sdf_font_by_target.setdefault(target_key, value)
         if preview_export:
             for file_name, assets_name, path_id in preview_target_lookup.keys():
@@ -7400,6 +8509,42 @@ def replace_fonts_in_file(
                 target_key = (str(assets_name), int(path_id))
                 target_sdf_targets.add(target_key)
                 target_sdf_pathids.add(int(path_id))
+
+    # KR: env.objects는 여기서 한 번만 순회해 타입별 (객체, 타입명) 목록으로 나눕니다.
+    #     폰트 패스와 텍스처/머티리얼 패스는 이 목록만 순회하고 type.name을 다시 읽지 않습니다.
+    #     폰트 객체는 교체/미리보기 대상 PathID인 것만 담아, 대상이 아닌 객체는 키 조회조차 하지 않습니다.
+    #     타입은 ClassIDType 멤버와 identity로 비교해 객체마다 Enum.name 프로퍼티를 호출하지 않습니다.
+    # EN: Walk env.objects once here and bucket (object, type name) pairs by type.
+    #     The font and texture/material passes iterate only these lists without re-reading type.name.
+    #     Font objects are kept only for target PathIDs, so non-targets never reach the per-object key lookups.
+    #     Types are compared by identity against ClassIDType members, avoiding the Enum.name property per object.
+    font_objects: list[tuple[Any, str]] = []
+    texture_material_objects: list[tuple[Any, str]] = []
+    font_class = ClassIDType.Font
+    mono_behaviour_class = ClassIDType.MonoBehaviour
+    texture_class = ClassIDType.Texture2D
+    material_class = ClassIDType.Material
+    for item in env.objects:
+        item_class = item.type
+        if item_class is font_class:
+            if replace_ttf and int(item.path_id) in target_ttf_pathids:
+                font_objects.append((item, "Font"))
+            continue
+        if item_class is mono_behaviour_class:
+            if replace_sdf and int(item.path_id) in target_sdf_pathids:
+                font_objects.append((item, "MonoBehaviour"))
+            continue
+        if item_class is texture_class:
+            texture_object_lookup[(item.assets_file.name, int(item.path_id))] = item
+            texture_material_objects.append((item, "Texture2D"))
+            continue
+        if item_class is material_class:
+            texture_material_objects.append((item, "Material"))
+            material_path_id = int(item.path_id)
+            material_object_count_by_pathid[material_path_id] = (
+                material_object_count_by_pathid.get(material_path_id, 0) + 1
+            )
+
     matched_sdf_targets = 0
     patched_sdf_targets = 0
     sdf_parse_failure_reasons: list[str] = []
@@ -7417,23 +8562,34 @@ def replace_fonts_in_file(
         _copy_patch_bucket(deferred_material_atlas_plans, current_file_key),
     )
     ambiguous_material_fallback_warned: set[int] = set()
+    # KR: 같은 교체 폰트를 쓰는 객체가 많아도 리소스 로드(정규화/캐시 stat 검증)는 조합별로 한 번만 수행합니다.
+    # EN: Load replacement resources (normalization/cache stat validation) once per combination,
+    # EN: even when many objects map to the same replacement font.
+    loaded_font_assets: dict[tuple[str, bool, int | None, bool], JsonDict] = {}
+    old_glyph_list_cache: dict[tuple[int, int], list[JsonDict]] = {}
     modified = False
 
-    for obj in env.objects:
+    for obj, obj_type in font_objects:
         assets_name = obj.assets_file.name
-        if obj.type.name == "Font" and replace_ttf:
+        if obj_type == "Font":
             font_pathid = obj.path_id
-            replacement_font = replacement_lookup.get(
-                ("TTF", fn_without_path, assets_name, font_pathid)
+            replacement_font = file_replacement_lookup.get(
+                ("TTF", assets_name, font_pathid)
             )
 
             if replacement_font:
-                assets = load_font_assets(replacement_font)
+                font_assets_key = (replacement_font, False, None, False)
+                assets = loaded_font_assets.get(font_assets_key)
+                if assets is None:
+                    assets = load_font_assets(replacement_font, decode_atlas=False)
+                    loaded_font_assets[font_assets_key] = assets
                 if assets["ttf_data"]:
                     font = _safe_parse_as_object(obj)
                     _raw_font_data = getattr(font, "m_FontData", b"")
                     current_ttf_data = _raw_font_data if isinstance(_raw_font_data, bytes) else bytes(_raw_font_data)
-                    if current_ttf_data == assets["ttf_data"]:
+                    # KR: mmap은 memoryview로 비교해 동일한 폰트면 bytes 복사 없이 건너뜁니다.
+                    # EN: Compare the mmap through a memoryview so identical fonts are skipped without a bytes copy.
+                    if memoryview(assets["ttf_data"]) == current_ttf_data:
                         _log_debug(
                             f"[replace_ttf] file={fn_without_path} assets={assets_name} path_id={font_pathid} "
                             f"name={font.m_Name} target={replacement_font} action=skip_same size={len(current_ttf_data)}"
@@ -7462,14 +8618,18 @@ def replace_fonts_in_file(
                         f"name={font.m_Name} target={replacement_font} "
                         f"old_size={len(current_ttf_data)} new_size={len(assets['ttf_data'])}"
                     )
-                    font.m_FontData = assets["ttf_data"]
+                    font.m_FontData = bytes(assets["ttf_data"])
                     _safe_save(obj, font)
                     modified = True
 
-        if obj.type.name == "MonoBehaviour" and replace_sdf:
+        if obj_type == "MonoBehaviour":
             pathid = obj.path_id
             target_key = (assets_name, int(pathid))
-            if target_sdf_targets and target_key not in target_sdf_targets:
+            # KR: 교체/미리보기 대상이 아닌 MonoBehaviour는 TypeTree 파싱 전에 건너뜁니다.
+            #     대상 집합이 비어 있으면 이 파일에서 적용할 SDF가 없으므로 모두 건너뜁니다.
+            # EN: Skip MonoBehaviours that are not replacement/preview targets before TypeTree parsing.
+            #     An empty target set means no SDF can be applied in this file, so every object is skipped.
+            if target_key not in target_sdf_targets:
                 continue
             try:
                 parse_dict = _safe_parse_as_dict(obj)
@@ -7482,16 +8642,18 @@ def replace_fonts_in_file(
                 )
                 if lang == "ko":
                     _log_console(f"  경고: {reason}")
-                    debug_parse_log(
-                        f"[replace_fonts] MonoBehaviour parse_as_dict 실패: {fn_without_path} | {reason}"
-                    )
+                    if debug_parse_enabled():
+                        debug_parse_log(
+                            f"[replace_fonts] MonoBehaviour parse_as_dict 실패: {fn_without_path} | {reason}"
+                        )
                 else:
                     _log_console(
                         f"  Warning: PathID {obj.path_id} parse_as_dict failed [{type(e).__name__}]: {e!r}"
                     )
-                    debug_parse_log(
-                        f"[replace_fonts] MonoBehaviour parse_as_dict failed: {fn_without_path} | {reason}"
-                    )
+                    if debug_parse_enabled():
+                        debug_parse_log(
+                            f"[replace_fonts] MonoBehaviour parse_as_dict failed: {fn_without_path} | {reason}"
+                        )
                 continue
             unity_version_hint_raw = getattr(obj.assets_file, "unity_version", None)
             unity_version_hint = str(unity_version_hint_raw or unity_version or "")
@@ -7530,8 +8692,8 @@ def replace_fonts_in_file(
                 continue
 
             objname = obj.peek_name()
-            replacement_font = replacement_lookup.get(
-                ("SDF", fn_without_path, assets_name, pathid)
+            replacement_font = file_replacement_lookup.get(
+                ("SDF", assets_name, pathid)
             )
             if replacement_font is None:
                 replacement_font = target_sdf_font_by_target.get(target_key)
@@ -7575,7 +8737,9 @@ def replace_fonts_in_file(
                             ),
                             lang=lang,
                         )
-                        preview_sdf_data = normalize_sdf_data(parse_dict)
+                        # KR: preview 전용 대상은 교체하지 않으므로 방금 파싱한 parse_dict를 복사 없이 정규화합니다.
+                        # EN: Preview-only targets are never replaced, so normalize the fresh parse_dict in place.
+                        preview_sdf_data = normalize_sdf_data(parse_dict, deep_copy=False)
                         _save_glyph_crop_previews(
                             target_preview_image,
                             preview_enabled=preview_export,
@@ -7590,7 +8754,7 @@ def replace_fonts_in_file(
 
             if replacement_font:
                 replacement_meta = replacement_meta_lookup.get(
-                    ("SDF", fn_without_path, assets_name, int(pathid)),
+                    ("SDF", assets_name, int(pathid)),
                     {},
                 )
                 replacement_process_swizzle = parse_bool_flag(
@@ -7623,11 +8787,20 @@ def replace_fonts_in_file(
                     if prefer_builtin_padding_variants
                     else None
                 )
-                assets = load_font_assets(
+                font_assets_key = (
                     replacement_font,
-                    prefer_raster=effective_force_raster,
-                    padding_variant=selected_padding_variant,
+                    bool(effective_force_raster),
+                    selected_padding_variant,
+                    True,
                 )
+                assets = loaded_font_assets.get(font_assets_key)
+                if assets is None:
+                    assets = load_font_assets(
+                        replacement_font,
+                        prefer_raster=effective_force_raster,
+                        padding_variant=selected_padding_variant,
+                    )
+                    loaded_font_assets[font_assets_key] = assets
                 if assets["sdf_data"] and assets["sdf_atlas"]:
                     if lang == "ko":
                         _log_console(
@@ -7682,25 +8855,11 @@ def replace_fonts_in_file(
                     game_padding_for_material = 0.0
 
                     # KR: GameObject/Script/Material/Atlas 참조는 기존 PathID를 유지해야 런타임 연결이 깨지지 않습니다.
+                    # KR: 교체 데이터는 GameObject/Script/Material/SourceFontFile 키를 건드리지 않으므로
+                    # KR: 원래 값이 그대로 남고, Atlas 참조만 아래에서 복원합니다.
                     # EN: GameObject/Script/Material/Atlas references must keep existing PathIDs to avoid breaking runtime linkage.
-                    m_GameObject_FileID = parse_dict["m_GameObject"]["m_FileID"]
-                    m_GameObject_PathID = parse_dict["m_GameObject"]["m_PathID"]
-                    m_Script_FileID = parse_dict["m_Script"]["m_FileID"]
-                    m_Script_PathID = parse_dict["m_Script"]["m_PathID"]
-                    has_source_font_ref = isinstance(
-                        parse_dict.get("m_SourceFontFile"), dict
-                    )
-                    if has_source_font_ref:
-                        m_SourceFontFile_FileID = int(
-                            parse_dict["m_SourceFontFile"].get("m_FileID", 0) or 0
-                        )
-                        m_SourceFontFile_PathID = int(
-                            parse_dict["m_SourceFontFile"].get("m_PathID", 0) or 0
-                        )
-                    else:
-                        m_SourceFontFile_FileID = 0
-                        m_SourceFontFile_PathID = 0
-
+                    # EN: The replacement never writes the GameObject/Script/Material/SourceFontFile keys, so
+                    # EN: they stay untouched; only the atlas references are restored below.
                     if parse_dict.get("m_Material") is not None:
                         m_Material_FileID = parse_dict["m_Material"]["m_FileID"]
                         m_Material_PathID = parse_dict["m_Material"]["m_PathID"]
@@ -7814,11 +8973,17 @@ def replace_fonts_in_file(
                         parse_dict["m_CharacterTable"] = replacement_character_table
 
                     if replacement_glyph_table:
-                        replacement_glyph_indexes = [
-                            int(g.get("m_Index", 0) or 0)
-                            for g in replacement_glyph_table
-                            if isinstance(g, dict)
-                        ]
+                        replacement_glyph_indexes = (
+                            assets.get("sdf_glyph_indexes")
+                            if replace_data is assets.get("sdf_data_normalized")
+                            else None
+                        )
+                        if replacement_glyph_indexes is None:
+                            replacement_glyph_indexes = tuple(
+                                int(g.get("m_Index", 0) or 0)
+                                for g in replacement_glyph_table
+                                if isinstance(g, dict)
+                            )
                         for glyph_index_key in _TMP_GLYPH_INDEX_LIST_KEYS:
                             if glyph_index_key in parse_dict:
                                 parse_dict[glyph_index_key] = list(
@@ -7920,11 +9085,31 @@ def replace_fonts_in_file(
                                 ),
                             )
                         )
-                        old_glyph_list = convert_glyphs_new_to_old(
-                            replacement_glyph_table,
-                            replacement_character_table,
-                            atlas_height=atlas_height,
+                        # KR: 캐시된 템플릿에서 만든 구형 글리프 목록은 같은 파일의 다른 구형 대상과 공유합니다.
+                        # EN: Share the old-format glyph list built from a cached template with other old-format targets in this file.
+                        old_glyph_cache_key = (id(replace_data), atlas_height)
+                        old_glyph_list = (
+                            old_glyph_list_cache.get(old_glyph_cache_key)
+                            if replace_data is assets.get("sdf_data_normalized")
+                            else None
                         )
+                        if old_glyph_list is None:
+                            # KR: 캐시된 템플릿이면 폰트당 한 번 만든 m_Index 색인을 재사용합니다.
+                            # EN: For the cached template, reuse the once-per-font m_Index lookup.
+                            old_glyph_list = convert_glyphs_new_to_old(
+                                replacement_glyph_table,
+                                replacement_character_table,
+                                atlas_height=atlas_height,
+                                glyph_by_index=(
+                                    assets.get("sdf_glyph_by_index")
+                                    if replace_data is assets.get("sdf_data_normalized")
+                                    else None
+                                ),
+                            )
+                            if replace_data is assets.get("sdf_data_normalized"):
+                                old_glyph_list_cache[old_glyph_cache_key] = (
+                                    old_glyph_list
+                                )
                         old_font_info["CharacterCount"] = len(old_glyph_list)
                         if target_has_old_face:
                             parse_dict["m_fontInfo"] = old_font_info
@@ -8019,30 +9204,8 @@ def replace_fonts_in_file(
                         if dirty_key in parse_dict:
                             parse_dict[dirty_key] = True
 
-                    # KR: 포맷 분기 후 공통 참조를 원래 값으로 되돌립니다.
-                    # EN: After format branching, restore common references to their original values.
-                    parse_dict["m_GameObject"]["m_FileID"] = m_GameObject_FileID
-                    parse_dict["m_GameObject"]["m_PathID"] = m_GameObject_PathID
-                    parse_dict["m_Script"]["m_FileID"] = m_Script_FileID
-                    parse_dict["m_Script"]["m_PathID"] = m_Script_PathID
-
-                    if parse_dict.get("m_Material") is not None:
-                        parse_dict["m_Material"]["m_FileID"] = m_Material_FileID
-                        parse_dict["m_Material"]["m_PathID"] = m_Material_PathID
-                    else:
-                        parse_dict["material"]["m_FileID"] = m_Material_FileID
-                        parse_dict["material"]["m_PathID"] = m_Material_PathID
-
-                    if has_source_font_ref and isinstance(
-                        parse_dict.get("m_SourceFontFile"), dict
-                    ):
-                        parse_dict["m_SourceFontFile"][
-                            "m_FileID"
-                        ] = m_SourceFontFile_FileID
-                        parse_dict["m_SourceFontFile"][
-                            "m_PathID"
-                        ] = m_SourceFontFile_PathID
-
+                    # KR: 포맷 분기 후 Atlas 참조를 원래 값으로 되돌립니다.
+                    # EN: After format branching, restore atlas references to their original values.
                     current_new_atlas_ref = _first_valid_atlas_ref(
                         parse_dict.get("m_AtlasTextures")
                     ) or _first_atlas_ref(parse_dict.get("m_AtlasTextures"))
@@ -8366,7 +9529,7 @@ def replace_fonts_in_file(
                     missing_parts: list[str] = []
                     if assets.get("sdf_data") is None:
                         missing_parts.append("json")
-                    if assets.get("sdf_atlas") is None:
+                    if assets.get("sdf_atlas_path") is None:
                         missing_parts.append("atlas")
                     if lang == "ko":
                         _log_console(
@@ -8379,6 +9542,14 @@ def replace_fonts_in_file(
                             f"(missing: {', '.join(missing_parts) if missing_parts else 'unknown'})"
                         )
 
+    # KR: 같은 atlas를 가리키는 여러 Alpha8 Texture2D가 같은 바이트를 다시 인코딩하지 않도록
+    # KR: (원본 이미지 id, swizzle 옵션, 타겟 상태) 기준으로 결과를 재사용합니다. 원본 이미지를 함께 보관해 id가 재사용되지 않게 합니다.
+    # EN: Reuse Alpha8 encodings keyed by (source image id, swizzle option, target state) so multiple
+    # EN: Texture2D objects sharing an atlas do not re-encode the same bytes. The source image is kept alive so its id is not reused.
+    alpha8_encode_cache: dict[
+        tuple[int, bool, bool | None],
+        tuple[Image.Image, tuple[bytes, int, int, str]],
+    ] = {}
     phase_started_at = time.perf_counter()
     _emit_phase_callback(
         phase_callback,
@@ -8390,26 +9561,58 @@ def replace_fonts_in_file(
             else None
         ),
     )
-    for obj in env.objects:
+    # KR: 계획 키("assets|PathID")의 PathID만 먼저 모아, 계획이 없는 텍스처/머티리얼은 키 생성과 파싱 전에 건너뜁니다.
+    # EN: Collect the PathIDs of plan keys ("assets|PathID") first so textures/materials without a plan
+    #     are skipped before key building and parsing.
+    texture_plan_pathids: set[int] = set()
+    for plan_key in texture_patch_plans:
+        path_id_text = plan_key.rpartition("|")[2]
+        if path_id_text.lstrip("-").isdigit():
+            texture_plan_pathids.add(int(path_id_text))
+    material_plan_pathids: set[int] = set(material_replacements_by_pathid)
+    for plan_key in material_replacements:
+        path_id_text = plan_key.rpartition("|")[2]
+        if path_id_text.lstrip("-").isdigit():
+            material_plan_pathids.add(int(path_id_text))
+    material_atlas_plan_pathids: set[int] = set()
+    for plan_key in material_replacements_by_atlas:
+        path_id_text = plan_key.rpartition("|")[2]
+        if path_id_text.lstrip("-").isdigit():
+            material_atlas_plan_pathids.add(int(path_id_text))
+    for obj, obj_type in texture_material_objects:
+        # KR: PathID 정수 변환은 객체당 한 번만 하고 아래 키/로그에서 재사용합니다.
+        # EN: Convert the PathID to int once per object and reuse it for the keys/logs below.
+        obj_path_id = int(obj.path_id)
+        if obj_type == "Texture2D" and obj_path_id not in texture_plan_pathids:
+            continue
+        # KR: atlas 기준 머티리얼 계획이 없으면 _MainTex 확인용 파싱도 필요 없습니다.
+        # EN: Without atlas-keyed material plans, parsing just to inspect _MainTex is unnecessary.
+        if (
+            obj_type == "Material"
+            and not material_replacements_by_atlas
+            and obj_path_id not in material_plan_pathids
+        ):
+            continue
         assets_name = obj.assets_file.name
-        if obj.type.name == "Texture2D":
-            replacement_key = _make_assets_object_key(assets_name, int(obj.path_id))
+        if obj_type == "Texture2D":
+            replacement_key = _make_assets_object_key(assets_name, obj_path_id)
             texture_plan = _lookup_patch_value(texture_patch_plans, replacement_key)
             if isinstance(texture_plan, dict):
                 parse_dict = _safe_parse_as_object(obj)
+                texture_name = obj.peek_name()
                 if lang == "ko":
                     _log_console(
-                        f"텍스처 교체: {obj.peek_name()} (PathID: {obj.path_id})"
+                        f"텍스처 교체: {texture_name} (PathID: {obj.path_id})"
                     )
                 else:
                     _log_console(
-                        f"Texture replaced: {obj.peek_name()} (PathID: {obj.path_id})"
+                        f"Texture replaced: {texture_name} (PathID: {obj.path_id})"
                     )
                 prepared_texture = _prepare_texture_replacement_for_target(
                     texture_plan,
                     assets_file_name=fn_without_path,
                     target_assets_name=assets_name,
-                    target_path_id=int(obj.path_id),
+                    target_path_id=obj_path_id,
                     texture_object_lookup=texture_object_lookup,
                     texture_swizzle_state_cache=texture_swizzle_state_cache,
                     ps5_swizzle=ps5_swizzle,
@@ -8442,7 +9645,7 @@ def replace_fonts_in_file(
                     texture_format = -1
                 _log_debug(
                     f"[replace_texture] file={fn_without_path} assets={assets_name} path_id={obj.path_id} "
-                    f"name={obj.peek_name()} texture_format={texture_format} metadata={metadata_w}x{metadata_h}"
+                    f"name={texture_name} texture_format={texture_format} metadata={metadata_w}x{metadata_h}"
                 )
                 if (
                     texture_format == 1
@@ -8458,11 +9661,23 @@ def replace_fonts_in_file(
                         #     RGBA 기준 swizzle 후 알파만 추출하면 바이트 순서가 깨질 수 있습니다.
                         # EN: Alpha8 must be encoded via the bpe=1 path.
                         #     Extracting only the alpha channel after RGBA-based swizzle can corrupt byte order.
-                        alpha_raw, aw, ah, alpha_mode = _encode_alpha8_replacement_bytes(
-                            alpha_source,
-                            ps5_swizzle=ps5_swizzle,
-                            target_swizzled_state=target_swizzled_state,
+                        alpha8_cache_key = (
+                            id(alpha_source),
+                            bool(ps5_swizzle),
+                            target_swizzled_state,
                         )
+                        cached_alpha8 = alpha8_encode_cache.get(alpha8_cache_key)
+                        if cached_alpha8 is None:
+                            cached_alpha8 = (
+                                alpha_source,
+                                _encode_alpha8_replacement_bytes(
+                                    alpha_source,
+                                    ps5_swizzle=ps5_swizzle,
+                                    target_swizzled_state=target_swizzled_state,
+                                ),
+                            )
+                            alpha8_encode_cache[alpha8_cache_key] = cached_alpha8
+                        alpha_raw, aw, ah, alpha_mode = cached_alpha8[1]
                         parse_dict.m_Width = int(metadata_w if metadata_w > 0 else aw)
                         parse_dict.m_Height = int(metadata_h if metadata_h > 0 else ah)
                         if hasattr(parse_dict, "m_CompleteImageSize"):
@@ -8554,12 +9769,17 @@ def replace_fonts_in_file(
                     _safe_save(obj, parse_dict)
                 modified = True
                 parse_dict = None
-        if obj.type.name == "Material":
+        if obj_type == "Material":
             parse_dict = None
-            material_key = _make_assets_object_key(assets_name, int(obj.path_id))
-            mat_info = _lookup_patch_value(material_replacements, material_key)
-            if mat_info is None:
-                fallback_path_id = int(obj.path_id)
+            mat_info = None
+            # KR: PathID가 어떤 머티리얼 계획에도 없으면 문자열 키 생성/조회(소문자 폴백 포함)는 항상 빗나가므로 건너뜁니다.
+            # EN: If the PathID is in no material plan, string key building/lookup (incl. the lowercase fallback)
+            #     always misses, so skip it.
+            if obj_path_id in material_plan_pathids:
+                material_key = _make_assets_object_key(assets_name, obj_path_id)
+                mat_info = _lookup_patch_value(material_replacements, material_key)
+            if mat_info is None and obj_path_id in material_plan_pathids:
+                fallback_path_id = obj_path_id
                 if fallback_path_id in material_replacements_by_pathid:
                     if material_object_count_by_pathid.get(fallback_path_id, 0) == 1:
                         mat_info = material_replacements_by_pathid[fallback_path_id]
@@ -8595,7 +9815,10 @@ def replace_fonts_in_file(
                                     getattr(tex_ref, "m_PathID", 0) or 0
                                 )
                             break
-                if main_tex_path_id > 0:
+                if (
+                    main_tex_path_id > 0
+                    and main_tex_path_id in material_atlas_plan_pathids
+                ):
                     atlas_key = _make_assets_object_key(assets_name, main_tex_path_id)
                     mat_info = _lookup_patch_value(
                         material_replacements_by_atlas,
@@ -8641,12 +9864,9 @@ def replace_fonts_in_file(
             # EN: If use_save_to=True and save_to() exists, save directly to file.
             save_to_fn = getattr(env_file, "save_to", None)
             if use_save_to and save_path and callable(save_to_fn):
-                try:
-                    supports_packer = (
-                        "packer" in inspect.signature(save_to_fn).parameters
-                    )
-                except (TypeError, ValueError):
-                    supports_packer = False
+                supports_packer = _callable_accepts_packer(
+                    getattr(save_to_fn, "__func__", save_to_fn)
+                )
                 if packer is None or not supports_packer:
                     return save_to_fn(save_path)
                 return save_to_fn(save_path, packer=packer)
@@ -8661,10 +9881,9 @@ def replace_fonts_in_file(
             typed_save = cast(Callable[..., bytes], save_fn)
             # KR: save() 시그니처를 기준으로 packer 지원 여부를 판별해 내부 TypeError를 가리지 않도록 합니다.
             # EN: Check packer support based on save() signature to avoid masking internal TypeErrors.
-            try:
-                supports_packer = "packer" in inspect.signature(typed_save).parameters
-            except (TypeError, ValueError):
-                supports_packer = False
+            supports_packer = _callable_accepts_packer(
+                getattr(typed_save, "__func__", typed_save)
+            )
 
             if packer is None or not supports_packer:
                 return typed_save()
@@ -8698,6 +9917,37 @@ def replace_fonts_in_file(
                 )
                 validation_started_at = time.perf_counter()
                 validation_inner_names = _collect_validation_inner_names(env_file)
+                if saved_signature == "UnityFS":
+                    # KR: UnityFS는 검증 워커도 헤더/블록/디렉터리 structural 검증만 수행하므로,
+                    #     새 Python 프로세스(UnityPy 재임포트)를 띄우지 않고 같은 검증을 프로세스 안에서 실행합니다.
+                    # EN: For UnityFS the worker only runs the header/block/directory structural check,
+                    #     so run that same check in-process instead of spawning Python (and re-importing UnityPy).
+                    try:
+                        is_valid, structural_reason = _structural_validate_unityfs_bundle(
+                            saved_path,
+                            inner_names=validation_inner_names,
+                        )
+                    except Exception as structural_error:
+                        is_valid = False
+                        structural_reason = (
+                            f"{type(structural_error).__name__}: {structural_error}"
+                        )
+                    reason = None if is_valid else f"structural: {structural_reason}"
+                    if reason is not None:
+                        if lang == "ko":
+                            _log_console(f"  저장 검증 실패 [{reason}]")
+                        else:
+                            _log_console(f"  Save validation failed [{reason}]")
+                    _emit_phase_callback(
+                        phase_callback,
+                        "validate_end",
+                        file=fn_without_path,
+                        path=saved_path,
+                        elapsed_sec=(time.perf_counter() - validation_started_at),
+                        ok=is_valid,
+                        reason=reason,
+                    )
+                    return is_valid, reason
                 if getattr(sys, "frozen", False):
                     cmd = [sys.executable, "--_validate-bundle", saved_path]
                 else:
@@ -8775,6 +10025,9 @@ def replace_fonts_in_file(
             tmp_file = os.path.join(tmp_path, fn_without_path)
             has_save_to = callable(getattr(env_file, "save_to", None))
             saved_blob: bytes | None = None
+            # KR: 전체 gc는 대형 UnityPy 힙에서 수 초가 걸리므로, bytes blob을 실제로 만든 경우에만 수행합니다.
+            # EN: A full gc can take seconds on a large UnityPy heap, so only run it when a bytes blob was materialized.
+            blob_materialized = False
             try:
                 _emit_phase_callback(
                     phase_callback,
@@ -8809,8 +10062,8 @@ def replace_fonts_in_file(
 
                     if use_stream_fallback:
                         saved_blob = _save_env_file(packer_label, use_save_to=False)
-                        with open(tmp_file, "wb") as f:
-                            f.write(cast(bytes, saved_blob))
+                        blob_materialized = True
+                        _write_blob_file(tmp_file, cast(bytes, saved_blob))
                         saved_blob = None
                 elif has_save_to:
                     # KR: save_to()로 파일에 직접 저장 — bytes 중간 변수 없음 (메모리 절약)
@@ -8820,12 +10073,14 @@ def replace_fonts_in_file(
                     # KR: 기존 bytes 반환 방식 폴백
                     # EN: Fallback to legacy bytes-returning approach
                     saved_blob = _save_env_file(packer_label, use_save_to=False)
-                    with open(tmp_file, "wb") as f:
-                        f.write(cast(bytes, saved_blob))
+                    blob_materialized = True
+                    _write_blob_file(tmp_file, cast(bytes, saved_blob))
                     # KR: 검증 전에 큰 메모리 블록을 해제하여 피크 메모리 사용량을 낮춥니다.
                     # EN: Free large memory blocks before validation to reduce peak memory usage.
                     saved_blob = None
-                gc.collect()
+                if blob_materialized:
+                    gc.collect()
+                    blob_materialized = False
                 is_valid, validation_reason = _validate_saved_file(tmp_file)
                 if not is_valid:
                     try:
@@ -8911,71 +10166,75 @@ def replace_fonts_in_file(
                 return False
             finally:
                 saved_blob = None
-                gc.collect()
-
-        dataflags = getattr(env_file, "dataflags", None)
-        safe_none_packer = (int(dataflags), 0) if dataflags is not None else "none"
+                if blob_materialized:
+                    gc.collect()
+
+        # KR: dataflags는 저장 시도 사이에 바뀌지 않으므로 정수 변환을 한 번만 하고 packer들을 만듭니다.
+        # EN: dataflags does not change between save attempts, so coerce it to int once and build the packers from it.
+        raw_dataflags = getattr(env_file, "dataflags", None)
+        dataflags = int(raw_dataflags) if raw_dataflags is not None else None
+        safe_none_packer = (dataflags, 0) if dataflags is not None else "none"
         legacy_none_packer = (
-            ((int(dataflags) & ~0x3F), 0) if dataflags is not None else None
+            ((dataflags & ~0x3F), 0) if dataflags is not None else None
+        )
+        # KR: 압축 비트가 이미 0이면 레거시 비트마스크 packer가 첫 시도와 같아 같은 저장/검증을 반복하므로 생략합니다.
+        # EN: When the compression bits are already 0 the legacy bitmask packer equals the first attempt
+        #     and would redo the same save/validation, so skip it.
+        if legacy_none_packer == safe_none_packer:
+            legacy_none_packer = None
+
+        original_attempt = (
+            "original",
+            "  원본 압축 모드로 재시도...",
+            "  Retrying with original compression...",
+        )
+        lz4_attempt = (
+            "lz4",
+            "  lz4 압축 모드로 재시도...",
+            "  Retrying with lz4 packer...",
         )
-
         if prefer_original_compress:
             # KR: 옵션이 있으면 원본 압축 우선으로 저장합니다.
             # EN: If the option is set, save with original compression first.
-            if not _try_save("original", "1"):
-                if lang == "ko":
-                    _log_console("  lz4 압축 모드로 재시도...")
-                else:
-                    _log_console("  Retrying with lz4 packer...")
-                if not _try_save("lz4", "2"):
-                    if lang == "ko":
-                        _log_console("  비압축 계열 모드로 재시도...")
-                    else:
-                        _log_console("  Retrying with uncompressed-style packer...")
-                    if (
-                        not _try_save(safe_none_packer, "3")
-                        and legacy_none_packer is not None
-                    ):
-                        if lang == "ko":
-                            _log_console("  레거시 비트마스크 모드로 재시도...")
-                        else:
-                            _log_console("  Retrying with legacy bitmask packer...")
-                        _try_save(legacy_none_packer, "4")
+            save_attempts = [
+                original_attempt,
+                lz4_attempt,
+                (
+                    safe_none_packer,
+                    "  비압축 계열 모드로 재시도...",
+                    "  Retrying with uncompressed-style packer...",
+                ),
+                (
+                    legacy_none_packer,
+                    "  레거시 비트마스크 모드로 재시도...",
+                    "  Retrying with legacy bitmask packer...",
+                ),
+            ]
         else:
             # KR: 기본은 무압축 계열 우선으로 저장해 시간을 줄이고, 실패 시 압축 모드로 폴백합니다.
             # EN: By default, save with uncompressed-family first to reduce time; fall back to compressed mode on failure.
-            if not _try_save(safe_none_packer, "1"):
-                if legacy_none_packer is not None:
-                    if lang == "ko":
-                        _log_console("  레거시 비트마스크 무압축 모드로 재시도...")
-                    else:
-                        _log_console(
-                            "  Retrying with legacy bitmask uncompressed packer..."
-                        )
-                    if _try_save(legacy_none_packer, "2"):
-                        pass
-                    else:
-                        if lang == "ko":
-                            _log_console("  원본 압축 모드로 재시도...")
-                        else:
-                            _log_console("  Retrying with original compression...")
-                        if not _try_save("original", "3"):
-                            if lang == "ko":
-                                _log_console("  lz4 압축 모드로 재시도...")
-                            else:
-                                _log_console("  Retrying with lz4 packer...")
-                            _try_save("lz4", "4")
+            save_attempts = [
+                (safe_none_packer, "", ""),
+                (
+                    legacy_none_packer,
+                    "  레거시 비트마스크 무압축 모드로 재시도...",
+                    "  Retrying with legacy bitmask uncompressed packer...",
+                ),
+                original_attempt,
+                lz4_attempt,
+            ]
+        attempt_number = 0
+        for attempt_packer, retry_message_ko, retry_message_en in save_attempts:
+            if attempt_packer is None:
+                continue
+            attempt_number += 1
+            if attempt_number > 1:
+                if lang == "ko":
+                    _log_console(retry_message_ko)
                 else:
-                    if lang == "ko":
-                        _log_console("  원본 압축 모드로 재시도...")
-                    else:
-                        _log_console("  Retrying with original compression...")
-                    if not _try_save("original", "2"):
-                        if lang == "ko":
-                            _log_console("  lz4 압축 모드로 재시도...")
-                        else:
-                            _log_console("  Retrying with lz4 packer...")
-                        _try_save("lz4", "3")
+                    _log_console(retry_message_en)
+            if _try_save(attempt_packer, str(attempt_number)):
+                break
 
         close_unitypy_env(env)
         gc.collect()
@@ -8984,7 +10243,7 @@ def replace_fonts_in_file(
             saved_file_path = os.path.join(tmp_path, fn_without_path)
             if os.path.exists(saved_file_path):
                 saved_size = os.path.getsize(saved_file_path)
-                shutil.move(saved_file_path, assets_file)
+                _replace_file(saved_file_path, assets_file)
                 _log_debug(
                     f"[save] file={fn_without_path} output={assets_file} temp={saved_file_path} bytes={saved_size}"
                 )
@@ -9029,8 +10288,10 @@ def replace_fonts_in_file(
             if sdf_parse_failure_reasons:
                 _log_console(f"  Parse error: {sdf_parse_failure_reasons[-1]}")
 
-    if os.path.exists(tmp_path):
-        shutil.rmtree(tmp_path)
+    try:
+        os.remove(stale_tmp_file)
+    except FileNotFoundError:
+        pass
     if not using_custom_temp_root and os.path.isdir(tmp_root):
         try:
             os.rmdir(tmp_root)
@@ -9117,6 +10378,21 @@ def create_batch_replacements(
     return replacements
 
 
+def _count_replacement_types(replacements: dict[str, JsonDict]) -> tuple[int, int]:
+    """KR: 교체 매핑의 TTF/SDF 항목 수를 한 번의 순회로 함께 셉니다.
+    EN: Counts TTF and SDF entries of a replacement mapping together in a single pass.
+    """
+    ttf_count = 0
+    sdf_count = 0
+    for value in replacements.values():
+        font_type = value.get("Type")
+        if font_type == "TTF":
+            ttf_count += 1
+        elif font_type == "SDF":
+            sdf_count += 1
+    return ttf_count, sdf_count
+
+
 def create_preview_export_targets(
     game_path: str,
     target_files: set[str] | None = None,
@@ -9469,6 +10745,16 @@ def _structural_validate_unityfs_bundle(
     if structure is None:
         return False, reason
 
+    # KR: 헤더의 전체 파일 크기와 실제 크기가 다르면 잘린/덧붙은 저장이므로 바로 실패합니다.
+    # EN: A header total size that differs from the actual size means a truncated/padded save; fail fast.
+    total_file_size = int(structure.get("total_file_size") or 0)
+    actual_file_size = os.path.getsize(bundle_path)
+    if total_file_size != actual_file_size:
+        return (
+            False,
+            f"bundle size mismatch (header: {total_file_size}, file: {actual_file_size})",
+        )
+
     directory_infos = cast(list[JsonDict], structure.get("directory_infos") or [])
     if not directory_infos:
         return False, "bundle has no directory infos"
@@ -9610,30 +10896,42 @@ def run_scan_file_worker(
     output_path: str,
     lang: Language = "ko",
     detect_ps5_swizzle: bool = False,
+    unity_version: str | None = None,
 ) -> int:
     """KR: 단일 파일 파싱 워커입니다. 결과를 JSON 파일로 저장합니다.
+    unity_version이 주어지면 버전 감지를 건너뜁니다.
     EN: Single-file parsing worker. Saves results to a JSON file.
+    Skips version detection when unity_version is given.
     """
     try:
         game_path, data_path = resolve_game_path(game_path, lang=lang)
-        unity_version = get_unity_version(game_path, lang=lang)
-        compile_method = get_compile_method(data_path)
-        generator = _create_generator(
-            unity_version, game_path, data_path, compile_method, lang=lang
-        )
+        if not unity_version:
+            unity_version = get_unity_version(game_path, lang=lang)
+        worker_unity_version: str = unity_version
+
+        # KR: 워커는 파일마다 새 프로세스라 생성기(DLL/메타데이터 로드)를 매번 다시 만듭니다.
+        #     TypeTree 생성기는 MonoBehaviour 파싱에만 쓰이므로, 그런 객체가 있는 파일에서만 만듭니다.
+        # EN: Each worker is a fresh process, so the generator (DLL/metadata load) is rebuilt every time.
+        #     It is only used to parse MonoBehaviours, so build it only for files that contain one.
+        def _build_worker_generator() -> TypeTreeGenerator:
+            compile_method = get_compile_method(data_path)
+            return _create_generator(
+                worker_unity_version, game_path, data_path, compile_method, lang=lang
+            )
+
         scanned, load_error = _scan_fonts_in_asset_file(
             assets_file,
-            generator,
+            None,
             lang=lang,
             detect_ps5_swizzle=detect_ps5_swizzle,
+            generator_factory=_build_worker_generator,
         )
         payload: JsonDict = {
             "ttf": scanned.get("ttf", []),
             "sdf": scanned.get("sdf", []),
             "error": load_error,
         }
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False)
+        _write_json_file(output_path, payload)
         return 0
     except Exception as e:
         if lang == "ko":
@@ -9686,7 +10984,7 @@ def main_cli(lang: Language = "ko") -> None:
             "원본 파일은 유지하고, 수정된 파일만 지정 폴더에 원본 상대 경로로 저장"
         )
         preview_help = "모든 SDF 폰트 Atlas/Glyph crop 미리보기를 preview 폴더에 저장 (--ps5-swizzle와 함께면 unswizzle 기준)"
-        scan_jobs_help = "폰트 스캔 병렬 워커 수 (기본: 1, parse/일괄교체 스캔에 적용, 별칭: --max-workers)"
+        scan_jobs_help = f"폰트 스캔 병렬 워커 수 (기본: {DEFAULT_SCAN_JOBS}, parse/일괄교체 스캔에 적용, 별칭: --max-workers)"
         split_save_force_help = (
             "대형 SDF 다건 교체에서 one-shot을 건너뛰고 SDF 1개씩 강제 분할 저장"
         )
@@ -9728,7 +11026,7 @@ Examples:
         temp_dir_help = "Root path for temporary save files (fast SSD/NVMe recommended)"
         output_only_help = "Keep originals untouched and write modified files only to this folder (preserve relative paths)"
         preview_help = "Export preview PNGs (Atlas + glyph crops) for all SDF fonts into preview folder (unswizzled when used with --ps5-swizzle)"
-        scan_jobs_help = "Number of parallel scan workers (default: 1, used for parse/bulk scan paths, alias: --max-workers)"
+        scan_jobs_help = f"Number of parallel scan workers (default: {DEFAULT_SCAN_JOBS}, used for parse/bulk scan paths, alias: --max-workers)"
         split_save_force_help = "Skip one-shot and force one-by-one SDF split save for large multi-SDF replacements"
         oneshot_save_force_help = "Force one-shot save even for large multi-SDF targets (disable split-save fallback)"
         ps5_swizzle_help = "Enable PS5 swizzle detect/transform mode (mask_x=0x385F0, mask_y=0x07A0F, rotate=90 compensation)"
@@ -9782,7 +11080,7 @@ Examples:
         "--max-workers",
         dest="scan_jobs",
         type=int,
-        default=1,
+        default=DEFAULT_SCAN_JOBS,
         metavar="N",
         help=scan_jobs_help,
     )
@@ -9815,6 +11113,12 @@ Examples:
         metavar="OUTPUT_JSON_PATH",
         help=argparse.SUPPRESS,
     )
+    parser.add_argument(
+        "--_scan-file-worker-unity-version",
+        type=str,
+        metavar="UNITY_VERSION",
+        help=argparse.SUPPRESS,
+    )
 
     args = parser.parse_args()
     if isinstance(args.gamepath, str):
@@ -9833,9 +11137,15 @@ Examples:
     verbose_path: str | None = None
     if args.verbose:
         verbose_path = os.path.join(get_script_dir(), VERBOSE_LOG_FILENAME)
+    # KR: stdout이 파일/파이프로 리다이렉트되면 레코드마다 flush하지 않는다.
+    #     scan 워커는 크래시 시 부모가 출력을 진단에 쓰므로 레코드마다 flush를 유지한다.
+    # EN: Skip per-record flushes when stdout is redirected to a file/pipe.
+    #     Scan workers keep per-record flushing since the parent uses their output to diagnose crashes.
+    stdout_is_tty = sys.stdout is not None and sys.stdout.isatty()
     _configure_logging(
         console_level=logging.INFO,
         verbose_log_path=verbose_path,
+        throttle_console=not stdout_is_tty and not args._scan_file_worker,
     )
     py_bits = struct.calcsize("P") * 8
     _log_console(f"Python {sys.version} ({py_bits}-bit)")
@@ -9958,6 +11268,7 @@ Examples:
                 args._scan_file_worker_output,
                 lang=lang,
                 detect_ps5_swizzle=args.ps5_swizzle,
+                unity_version=args._scan_file_worker_unity_version,
             )
         )
 
@@ -10165,7 +11476,7 @@ Examples:
                     else:
                         _log_console("JSON file path is required. Please try again.")
                     continue
-                if os.path.exists(entered):
+                if os.path.isfile(entered):
                     args.list = entered
                     break
                 if is_ko:
@@ -10181,6 +11492,14 @@ Examples:
 
     args.preview_export = mode == "preview_export"
 
+    # KR: --list 경로는 Il2CppDumper 실행이나 버전 감지 전에 확인해 잘못된 입력에 시간을 쓰지 않습니다.
+    # EN: Check the --list path before Il2CppDumper or version detection so bad input fails fast.
+    if mode == "list" and not interactive_session and not os.path.isfile(args.list):
+        if is_ko:
+            exit_with_error(f"'{args.list}' 파일을 찾을 수 없습니다.", lang=lang)
+        else:
+            exit_with_error(f"File not found: '{args.list}'", lang=lang)
+
     if output_only_root and mode == "preview_export":
         if is_ko:
             exit_with_error(
@@ -10277,8 +11596,8 @@ Examples:
     compile_method = get_compile_method(data_path)
     detected_unity_version = get_unity_version(game_path, lang=lang)
     default_temp_root = register_temp_dir_for_cleanup(os.path.join(data_path, "temp"))
-    if os.path.exists(default_temp_root):
-        shutil.rmtree(default_temp_root)
+    if os.path.isdir(default_temp_root):
+        _fast_rmtree(default_temp_root)
 
     replace_ttf = not args.sdfonly
     replace_sdf = not args.ttfonly
@@ -10331,9 +11650,8 @@ Examples:
         f"replace_ttf={replace_ttf} replace_sdf={replace_sdf}"
     )
 
-    if compile_method == "Il2cpp" and not os.path.exists(
-        os.path.join(data_path, "Managed")
-    ):
+    managed_dir = os.path.join(data_path, "Managed")
+    if compile_method == "Il2cpp" and not os.path.exists(managed_dir):
         binary_path = os.path.join(game_path, "GameAssembly.dll")
         metadata_path = os.path.join(
             data_path, "il2cpp_data", "Metadata", "global-metadata.dat"
@@ -10351,38 +11669,49 @@ Examples:
                 )
 
         dumper_path = os.path.join(get_script_dir(), "Il2CppDumper", "Il2CppDumper.exe")
-        target_path = os.path.join(data_path, "Managed_")
+        target_path = os.path.abspath(os.path.join(data_path, "Managed_"))
         os.makedirs(target_path, exist_ok=True)
         command = [
             os.path.abspath(dumper_path),
             os.path.abspath(binary_path),
             os.path.abspath(metadata_path),
-            os.path.abspath(target_path),
+            target_path,
         ]
         if is_ko:
             _log_console("Il2cpp 게임을 위한 Managed 폴더를 생성합니다...")
         else:
             _log_console("Creating Managed folder for Il2cpp game...")
-        _log_console(os.path.abspath(target_path))
+        _log_console(target_path)
 
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         startupinfo.wShowWindow = subprocess.SW_HIDE
         try:
-            process = subprocess.run(
+            # KR: 덤퍼 출력은 수십 MB가 될 수 있어 전부 모아 두지 않고, stderr를 합친 파이프에서 줄 단위로 바로 기록합니다.
+            # EN: Dumper output can reach tens of MB, so instead of capturing it all, log it line by line
+            #     from a single pipe with stderr merged in.
+            with subprocess.Popen(
                 command,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1 << 16,
                 text=True,
                 startupinfo=startupinfo,
                 encoding="utf-8",
-            )
-            if process.returncode == 0:
-                _log_console(process.stdout)
-                shutil.move(
-                    os.path.join(data_path, "Managed_", "DummyDll"),
-                    os.path.join(data_path, "Managed"),
-                )
-                shutil.rmtree(os.path.join(data_path, "Managed_"))
+                errors="replace",
+            ) as process:
+                for output_line in cast(Iterable[str], process.stdout):
+                    _log_console(output_line.rstrip("\r\n"))
+                returncode = process.wait()
+            if returncode == 0:
+                dummy_dll_dir = os.path.join(target_path, "DummyDll")
+                # KR: 같은 볼륨이면 이름 변경 한 번으로 끝내고, 실패할 때만 복사 기반 이동으로 폴백합니다.
+                # EN: Same-volume moves finish with one rename; fall back to a copying move only on failure.
+                try:
+                    os.rename(dummy_dll_dir, managed_dir)
+                except OSError:
+                    shutil.move(dummy_dll_dir, managed_dir)
+                _fast_rmtree(target_path)
                 if is_ko:
                     _log_console("더미 DLL 생성에 성공했습니다!")
                 else:
@@ -10393,7 +11722,6 @@ Examples:
                 else:
                     _log_console(f"Compile method re-detected: {compile_method}")
             else:
-                _log_console(process.stderr)
                 if is_ko:
                     exit_with_error("Il2cpp 더미 DLL 생성 실패", lang=lang)
                 else:
@@ -10444,36 +11772,15 @@ Examples:
             _log_console(f"Preview 대상 SDF 폰트: {len(replacements)}개")
         else:
             _log_console(f"Preview target SDF fonts: {len(replacements)}")
-    elif mode == "mulmaru":
-        if is_ko:
-            _log_console("Mulmaru 폰트로 일괄 교체합니다...")
-        else:
-            _log_console("Bulk replacing with Mulmaru...")
-        replacements = create_batch_replacements(
-            game_path,
-            "Mulmaru",
-            replace_ttf,
-            replace_sdf,
-            target_files=selected_files if selected_files else None,
-            exclude_exts=excluded_exts if excluded_exts else None,
-            scan_jobs=args.scan_jobs,
-            lang=lang,
-            ps5_swizzle=args.ps5_swizzle,
-        )
-        ttf_count = sum(1 for v in replacements.values() if v["Type"] == "TTF")
-        sdf_count = sum(1 for v in replacements.values() if v["Type"] == "SDF")
-        if is_ko:
-            _log_console(f"발견된 폰트: TTF {ttf_count}개, SDF {sdf_count}개")
-        else:
-            _log_console(f"Found fonts: TTF {ttf_count}, SDF {sdf_count}")
-    elif mode == "nanumgothic":
+    elif mode in ("mulmaru", "nanumgothic"):
+        bulk_font_name = "Mulmaru" if mode == "mulmaru" else "NanumGothic"
         if is_ko:
-            _log_console("NanumGothic 폰트로 일괄 교체합니다...")
+            _log_console(f"{bulk_font_name} 폰트로 일괄 교체합니다...")
         else:
-            _log_console("Bulk replacing with NanumGothic...")
+            _log_console(f"Bulk replacing with {bulk_font_name}...")
         replacements = create_batch_replacements(
             game_path,
-            "NanumGothic",
+            bulk_font_name,
             replace_ttf,
             replace_sdf,
             target_files=selected_files if selected_files else None,
@@ -10482,8 +11789,7 @@ Examples:
             lang=lang,
             ps5_swizzle=args.ps5_swizzle,
         )
-        ttf_count = sum(1 for v in replacements.values() if v["Type"] == "TTF")
-        sdf_count = sum(1 for v in replacements.values() if v["Type"] == "SDF")
+        ttf_count, sdf_count = _count_replacement_types(replacements)
         if is_ko:
             _log_console(f"발견된 폰트: TTF {ttf_count}개, SDF {sdf_count}개")
         else:
@@ -10515,8 +11821,7 @@ Examples:
             _log_console(f"'{args.list}' 파일을 읽어서 교체합니다...")
         else:
             _log_console(f"Replacing using '{args.list}'...")
-        with open(args.list, "r", encoding="utf-8") as f:
-            loaded = json.load(f)
+        loaded = _read_json_file(args.list)
         if not isinstance(loaded, dict):
             if is_ko:
                 exit_with_error("JSON 루트는 객체(dict)여야 합니다.", lang=lang)
@@ -10531,12 +11836,21 @@ Examples:
             exit_with_error("Replacement mapping was not generated.", lang=lang)
 
     if selected_files:
-        replacements = {
-            key: value
-            for key, value in replacements.items()
-            if isinstance(value, dict)
-            and os.path.basename(str(value.get("File", ""))) in selected_files
-        }
+        # KR: 수백 개 항목이 같은 File을 공유하므로 basename 판정은 고유 File 값마다 한 번만 합니다.
+        # EN: Hundreds of entries share the same File, so resolve the basename match once per distinct value.
+        selected_match_by_file: dict[str, bool] = {}
+        filtered_replacements: dict[str, JsonDict] = {}
+        for key, value in replacements.items():
+            if not isinstance(value, dict):
+                continue
+            file_text = str(value.get("File", ""))
+            matched = selected_match_by_file.get(file_text)
+            if matched is None:
+                matched = os.path.basename(file_text) in selected_files
+                selected_match_by_file[file_text] = matched
+            if matched:
+                filtered_replacements[key] = value
+        replacements = filtered_replacements
 
         if not replacements:
             target_text = ", ".join(sorted(selected_files))
@@ -10566,9 +11880,12 @@ Examples:
     preview_files_to_process: set[str] = set()
     if args.preview_export:
         preview_files_to_process = {
-            os.path.basename(str(value.get("File", "")))
-            for value in replacements.values()
-            if isinstance(value, dict) and str(value.get("Type", "")) == "SDF"
+            os.path.basename(file_text)
+            for file_text in {
+                str(value.get("File", ""))
+                for value in replacements.values()
+                if isinstance(value, dict) and str(value.get("Type", "")) == "SDF"
+            }
         }
         preview_files_to_process.discard("")
     process_files = set(files_to_process) | preview_files_to_process
@@ -10599,16 +11916,77 @@ Examples:
                 f"[runtime] duplicate_asset_basename={duplicate_name} "
                 f"count={len(duplicate_paths)} paths={duplicate_paths}"
             )
-    asset_file_queue: list[str] = [
-        asset_key
-        for asset_key, asset_path in asset_path_by_key.items()
-        if os.path.basename(asset_path) in process_files
-    ]
+    # KR: 전체 에셋 목록을 훑지 않고, 처리할 파일명에서 출발해 basename 인덱스로 키를 찾습니다.
+    #     키별 파일명(원래 대소문자)은 여기서 한 번만 기록해 처리 루프에서 재사용합니다.
+    # EN: Start from the file names to process and resolve keys via the basename index instead of
+    #     walking every asset; each key's original-case file name is recorded once for the loop.
+    file_name_by_key: dict[str, str] = {}
+    for file_name in process_files:
+        for asset_key in basename_to_keys.get(file_name.lower(), ()):
+            asset_path = asset_path_by_key.get(asset_key)
+            if asset_path and os.path.basename(asset_path) == file_name:
+                file_name_by_key[asset_key] = file_name
+    asset_file_queue: list[str] = sorted(
+        file_name_by_key, key=asset_path_by_key.__getitem__
+    )
     _log_debug(
         f"[runtime] matched_asset_files={len(asset_file_queue)} all_candidates={len(all_assets_files)}"
     )
+    if not args.temp_dir and mode != "preview_export":
+        # KR: 지연 패치로 큐에 더해질 파일도 있으므로 전체 후보 중 가장 큰 파일을 기준으로 공간을 판단합니다.
+        # EN: Deferred patches can append files to the queue, so size the check on the largest candidate overall.
+        largest_asset_bytes = 0
+        for candidate_path in all_assets_files:
+            try:
+                largest_asset_bytes = max(
+                    largest_asset_bytes, os.path.getsize(candidate_path)
+                )
+            except OSError:
+                continue
+        ram_temp_root = _select_ram_temp_root(largest_asset_bytes)
+        if ram_temp_root is not None:
+            args.temp_dir = register_temp_dir_for_cleanup(ram_temp_root)
+            if is_ko:
+                _log_console(f"임시 저장 경로: {args.temp_dir}")
+            else:
+                _log_console(f"Temp save path: {args.temp_dir}")
+    prefetched_output_targets: set[str] = set()
     if output_only_root and mode != "preview_export":
         prepare_output_only_dependencies(data_path, output_only_root, lang=lang)
+        # KR: 출력 대상 복사는 파일 간 독립적이므로 교체 루프 전에 병렬로 미리 처리합니다.
+        # EN: Output-target copies are independent per file, so run them in parallel before the replace loop.
+        prefetched_output_targets = prefetch_output_only_targets(
+            [
+                asset_path_by_key[asset_key]
+                for asset_key in asset_file_queue
+                if asset_key in asset_path_by_key
+            ],
+            data_path,
+            output_only_root,
+            max_workers=min(8, os.cpu_count() or 1),
+        )
+
+    # KR: 교체 항목을 File 기준으로 한 번만 나눠 두어, 파일마다 전체 JSON을 다시 훑지 않습니다.
+    #     entries_by_file은 Replace_to가 없는 항목(preview 대상)까지 담아 one-shot 호출에 넘깁니다.
+    # EN: Bucket replacement entries by File once so each file does not rescan the whole JSON.
+    #     entries_by_file also keeps entries without Replace_to (preview targets) for the one-shot call.
+    entries_by_file: dict[str, dict[str, JsonDict]] = {}
+    replacements_by_file: dict[str, dict[str, JsonDict]] = {}
+    ttf_replacements_by_file: dict[str, dict[str, JsonDict]] = {}
+    sdf_replacements_by_file: dict[str, dict[str, JsonDict]] = {}
+    for key, value in replacements.items():
+        if not isinstance(value, dict):
+            continue
+        file_key = value.get("File")
+        entries_by_file.setdefault(file_key, {})[key] = value
+        if not value.get("Replace_to"):
+            continue
+        replacements_by_file.setdefault(file_key, {})[key] = value
+        entry_type = value.get("Type")
+        if entry_type == "TTF":
+            ttf_replacements_by_file.setdefault(file_key, {})[key] = value
+        elif entry_type == "SDF":
+            sdf_replacements_by_file.setdefault(file_key, {})[key] = value
 
     deferred_texture_plans: dict[str, dict[str, Any]] = {}
     deferred_material_plans: dict[str, dict[str, Any]] = {}
@@ -10618,6 +11996,9 @@ Examples:
     prepared_output_targets: set[str] = set()
     modified_count = 0
     queue_index = 0
+    # KR: 파일 간 처리는 지연 패치 계획을 공유하므로 순차로 두고, 다음 파일 읽기만 백그라운드에서 겹칩니다.
+    # EN: Files share deferred patch plans, so processing stays sequential; only reading the next file overlaps in the background.
+    readahead_executor = ThreadPoolExecutor(max_workers=1)
     while queue_index < len(asset_file_queue):
         asset_file_key = asset_file_queue[queue_index]
         queue_index += 1
@@ -10626,7 +12007,15 @@ Examples:
         if not assets_file:
             _log_warning(f"[runtime] queued file not found: {asset_file_key}")
             continue
-        fn = os.path.basename(assets_file)
+        if queue_index < len(asset_file_queue):
+            next_assets_file = asset_path_by_key.get(asset_file_queue[queue_index])
+            if next_assets_file:
+                if output_only_root and mode != "preview_export":
+                    next_assets_file = resolve_output_only_path(
+                        next_assets_file, data_path, output_only_root
+                    )
+                readahead_executor.submit(_warm_file_cache, next_assets_file)
+        fn = file_name_by_key[asset_file_key]
         working_assets_file = assets_file
         if output_only_root and mode != "preview_export":
             working_assets_file = resolve_output_only_path(
@@ -10639,13 +12028,13 @@ Examples:
                 _normalize_asset_file_key(working_assets_file) or working_assets_file
             )
             if working_assets_key not in prepared_output_targets:
-                shutil.copy2(assets_file, working_assets_file)
+                if working_assets_key not in prefetched_output_targets:
+                    shutil.copy2(assets_file, working_assets_file)
                 prepared_output_targets.add(working_assets_key)
+                rel_out = os.path.relpath(working_assets_file, output_only_root)
                 if is_ko:
-                    rel_out = os.path.relpath(working_assets_file, output_only_root)
                     _log_console(f"  출력 대상 준비: {rel_out}")
                 else:
-                    rel_out = os.path.relpath(working_assets_file, output_only_root)
                     _log_console(f"  Prepared output target: {rel_out}")
         if (
             fn in process_files
@@ -10659,23 +12048,9 @@ Examples:
                 _log_console(f"\nProcessing: {fn}")
             # KR: 기본은 split-save 폴백을 사용하고, --oneshot-save-force일 때만 비활성화합니다.
             # EN: By default, use split-save fallback; only disable when --oneshot-save-force is set.
-            file_replacements = {
-                key: value
-                for key, value in replacements.items()
-                if isinstance(value, dict)
-                and value.get("File") == fn
-                and value.get("Replace_to")
-            }
-            file_ttf_replacements = {
-                key: value
-                for key, value in file_replacements.items()
-                if value.get("Type") == "TTF"
-            }
-            file_sdf_replacements = {
-                key: value
-                for key, value in file_replacements.items()
-                if value.get("Type") == "SDF"
-            }
+            file_replacements = replacements_by_file.get(fn, {})
+            file_ttf_replacements = ttf_replacements_by_file.get(fn, {})
+            file_sdf_replacements = sdf_replacements_by_file.get(fn, {})
             _log_replacement_plan_details(fn, file_replacements)
 
             file_modified = False
@@ -10761,9 +12136,6 @@ Examples:
                     suggested_sdf_batch_size = 0
                     split_stopped = False
                     if replace_ttf and file_ttf_replacements:
-                        file_ttf_lookup, _ = build_replacement_lookup(
-                            file_ttf_replacements
-                        )
                         try:
                             if replace_fonts_in_file(
                                 unity_version,
@@ -10780,7 +12152,7 @@ Examples:
                                 prefer_original_compress=args.original_compress,
                                 temp_root_dir=args.temp_dir,
                                 generator=generator,
-                                replacement_lookup=file_ttf_lookup,
+                                replacement_lookup=file_lookup,
                                 ps5_swizzle=args.ps5_swizzle,
                                 preview_export=args.preview_export,
                                 preview_root=preview_root,
@@ -10857,7 +12229,6 @@ Examples:
                             while idx < sdf_total:
                                 current_batch = min(batch_size, sdf_total - idx)
                                 batch_dict = dict(sdf_items[idx : idx + current_batch])
-                                batch_lookup, _ = build_replacement_lookup(batch_dict)
 
                                 try:
                                     ok = replace_fonts_in_file(
@@ -10875,7 +12246,7 @@ Examples:
                                         prefer_original_compress=args.original_compress,
                                         temp_root_dir=args.temp_dir,
                                         generator=generator,
-                                        replacement_lookup=batch_lookup,
+                                        replacement_lookup=file_lookup,
                                         ps5_swizzle=args.ps5_swizzle,
                                         preview_export=args.preview_export,
                                         preview_root=preview_root,
@@ -10974,12 +12345,16 @@ Examples:
                         _log_console(
                             "  Note: --oneshot-save-force disables split-save fallback and may increase memory peak."
                         )
+                # KR: 전체 JSON 대신 이 파일 항목만 넘겨, 호출 안의 룩업/메타 구성이 파일 항목 수에 비례하게 합니다.
+                # EN: Pass only this file's entries, not the whole JSON, so in-call lookup/meta setup scales with them.
+                file_entries = entries_by_file.get(fn, {})
+                file_entries_lookup, _ = build_replacement_lookup(file_entries)
                 try:
                     if replace_fonts_in_file(
                         unity_version,
                         game_path,
                         working_assets_file,
-                        replacements,
+                        file_entries,
                         replace_ttf,
                         replace_sdf,
                         use_game_mat=args.use_game_material,
@@ -10990,7 +12365,7 @@ Examples:
                         prefer_original_compress=args.original_compress,
                         temp_root_dir=args.temp_dir,
                         generator=generator,
-                        replacement_lookup=replacement_lookup,
+                        replacement_lookup=file_entries_lookup,
                         ps5_swizzle=args.ps5_swizzle,
                         preview_export=args.preview_export,
                         preview_root=preview_root,
@@ -11037,10 +12412,12 @@ Examples:
                     continue
                 asset_file_queue.append(pending_key)
                 pending_queue_keys.add(pending_key)
+                file_name_by_key.setdefault(pending_key, os.path.basename(pending_path))
                 _log_debug(
                     f"[runtime] queued_deferred_patch_file={pending_path} "
                     f"queue_size={len(asset_file_queue)}"
                 )
+    readahead_executor.shutdown(wait=False, cancel_futures=True)
 
     if mode == "preview_export":
         if is_ko: